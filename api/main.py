@@ -5,24 +5,38 @@ Aligned with /api/v1/jobs pattern used across all scrapers.
 """
 
 import asyncio
-import json
+import fcntl
+import multiprocessing
+import os
+import shutil
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 from uuid import uuid4
 
+import ijson
+import orjson
 from common.config import Config
+from common.job_index import JobIndex
 from common.job_metadata import JobMetadata, JobStatus
 from common.logger import get_logger
 from common.path_utils import PathUtils
 from csv_writer import TokopediaCSVWriter
-from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Query, Response
+from pydantic import BaseModel
 
-# Import the scraper and CSV writer
-from tokopedia_graphql import TokopediaGraphQLScraper
+# Scrapes run in worker processes; scrape_sync lives in the scraper module so
+# unpickling it there doesn't import this module and build the app
+from tokopedia_graphql import scrape_sync
 
 logger = get_logger(__name__)
 
+# Seconds between sweeps of the deleted-jobs trash directory
+TRASH_REAP_INTERVAL = 60
+
 
 class JobResponse(BaseModel):
     """Response model for job creation."""
@@ -42,9 +56,14 @@ class JobStatusResponse(BaseModel):
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
-    parameters: dict[str, Any] = Field(default_factory=dict)
-    results_summary: dict[str, Any] = Field(default_factory=dict)
-    output_files: list[str] = Field(default_factory=list)
+    # Always present in job metadata, so no per-instance default containers
+    parameters: dict[str, Any]
+    results_summary: dict[str, Any]
+    output_files: list[str]
+
+
+# Fields of the job metadata file served by the job status endpoint
+JOB_STATUS_FIELDS = tuple(JobStatusResponse.model_fields)
 
 
 class JobResultsResponse(BaseModel):
@@ -56,7 +75,8 @@ class JobResultsResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
-    items: list[dict[str, Any]]
+    # Items come straight from the results files; skip per-item validation
+    items: list[Any]
 
 
 class HealthResponse(BaseModel):
@@ -72,10 +92,64 @@ def create_app() -> FastAPI:
     config = Config.from_env()
     path_utils = PathUtils(config.base_dir)
 
+    # Scrape and queue limits are for the whole server; each uvicorn worker
+    # runs its own queue and pool, so split them between the workers
+    workers = max(config.workers, 1)
+    max_concurrent_scrapes = max(config.max_concurrent_scrapes // workers, 1)
+    max_queued_jobs = (
+        max(config.max_queued_jobs // workers, 1) if config.max_queued_jobs else 0
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Open the index at startup rather than import, so importing the
+        # module doesn't touch the results directory
+        job_index = JobIndex(path_utils.get_job_index_path())
+        # Backfill jobs created before the index existed. Held under a lock so
+        # that with several uvicorn workers only the first one does the sync.
+        with _lock_file(path_utils.results_dir / ".index-sync.lock"):
+            if job_index.count() == 0:
+                sync_job_index(job_index, path_utils)
+        app.state.job_index = job_index
+
+        # Size the executor used by asyncio.to_thread for file and index I/O
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.thread_pool_size)
+        )
+        # Scrapes run synchronously, so keep them out of the event loop process.
+        # forkserver avoids forking this (multi-threaded) process directly.
+        app.state.scraper_pool = ProcessPoolExecutor(
+            max_workers=max_concurrent_scrapes,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        # A fixed set of workers drains the queue, capping concurrent scrapes
+        app.state.job_queue = asyncio.Queue(maxsize=max_queued_jobs)
+        tasks = [
+            asyncio.create_task(_job_worker(app.state.job_queue))
+            for _ in range(max_concurrent_scrapes)
+        ]
+        # Only the uvicorn worker holding the reaper lock sweeps the trash
+        reaper_lock = _try_lock_file(path_utils.results_dir / ".trash-reaper.lock")
+        if reaper_lock is not None:
+            tasks.append(
+                asyncio.create_task(_trash_reaper(path_utils.get_trash_dir()))
+            )
+        try:
+            yield
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            app.state.scraper_pool.shutdown(wait=False, cancel_futures=True)
+            if reaper_lock is not None:
+                reaper_lock.close()
+            job_index.close()
+
     app = FastAPI(
         title="Tokopedia Scraper API",
         description="API for scraping Tokopedia product information",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     @app.get("/health", response_model=HealthResponse, tags=["Health"])
@@ -89,13 +163,15 @@ def create_app() -> FastAPI:
 
     @app.post("/api/v1/jobs", response_model=JobResponse, tags=["Jobs"])
     async def create_job(
-        background_tasks: BackgroundTasks,
         query: str = Query(..., description="Search query/keyword"),
         brand: Optional[str] = Query(default=None, description="Brand filter"),
         max_products: int = Query(default=100, ge=1, le=1000, description="Max products to scrape"),
         pages: Optional[int] = Query(default=None, ge=1, le=50, description="Number of pages"),
     ) -> JobResponse:
         """Create a new scraping job."""
+        if app.state.job_queue.full():
+            raise HTTPException(status_code=503, detail="Too many queued jobs, try again later")
+
         job_id = str(uuid4())
 
         # Create job metadata
@@ -107,20 +183,30 @@ def create_app() -> FastAPI:
             pages=pages,
         )
 
-        # Ensure job directories exist
-        path_utils.ensure_job_dirs(job_id)
-        job_metadata.save(path_utils.get_job_metadata_path(job_id))
-
-        # Run the job in the background
-        background_tasks.add_task(
-            run_scraper_job,
-            job_metadata,
-            path_utils,
-            query,
-            brand,
-            max_products,
-            pages,
-        )
+        # Persist the job off the event loop so it's visible as soon as we respond
+        metadata_path = path_utils.get_job_metadata_path(job_id)
+        job_index = app.state.job_index
+        await asyncio.to_thread(persist_new_job, job_metadata, path_utils, job_index)
+
+        # Queue the job for the scraper workers
+        try:
+            app.state.job_queue.put_nowait(
+                (
+                    job_metadata,
+                    path_utils,
+                    job_index,
+                    app.state.scraper_pool,
+                    query,
+                    brand,
+                    max_products,
+                    pages,
+                )
+            )
+        except asyncio.QueueFull:
+            # The queue filled up while the job was being persisted
+            job_metadata.update_status(JobStatus.FAILED, error_message="Job queue is full")
+            await asyncio.to_thread(job_metadata.save, metadata_path, job_index)
+            raise HTTPException(status_code=503, detail="Too many queued jobs, try again later")
 
         return JobResponse(
             job_id=job_id,
@@ -129,63 +215,71 @@ def create_app() -> FastAPI:
         )
 
     @app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse, tags=["Jobs"])
-    async def get_job_status(job_id: str) -> JobStatusResponse:
+    async def get_job_status(job_id: str) -> Response:
         """Get the status of a job."""
         metadata_path = path_utils.get_job_metadata_path(job_id)
 
-        if not metadata_path.exists():
+        try:
+            payload = await asyncio.to_thread(metadata_path.read_bytes)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        job_metadata = JobMetadata.load(metadata_path)
-
-        return JobStatusResponse(**job_metadata.to_dict())
+        # The metadata file also carries internal fields (results file, shard
+        # offsets); pass on only the JobStatusResponse ones, without validation
+        metadata = orjson.loads(payload)
+        content = {
+            field: metadata[field] for field in JOB_STATUS_FIELDS if field in metadata
+        }
+        content["results_summary"] = {
+            key: value
+            for key, value in metadata.get("results_summary", {}).items()
+            if key != "shard_offsets"
+        }
+        return Response(content=orjson.dumps(content), media_type="application/json")
 
     @app.get("/api/v1/jobs/{job_id}/results", response_model=JobResultsResponse, tags=["Jobs"])
     async def get_job_results(
         job_id: str,
         page: int = Query(default=1, ge=1, description="Page number"),
         page_size: int = Query(default=100, ge=1, le=1000, description="Items per page"),
-    ) -> JobResultsResponse:
+    ) -> Response:
         """Get paginated results for a job."""
         metadata_path = path_utils.get_job_metadata_path(job_id)
+        job_metadata = await asyncio.to_thread(load_job_metadata, metadata_path)
 
-        if not metadata_path.exists():
+        if job_metadata is None:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        job_metadata = JobMetadata.load(metadata_path)
-
-        # Load results from JSON files
-        json_dir = path_utils.get_job_json_dir(job_id)
-        all_items: list[dict[str, Any]] = []
-
-        if json_dir.exists():
-            for json_file in json_dir.glob("*.json"):
-                if json_file.name != "job_metadata.json":
-                    try:
-                        with open(json_file, "r") as f:
-                            data = json.load(f)
-                            if isinstance(data, list):
-                                all_items.extend(data)
-                            elif isinstance(data, dict):
-                                all_items.append(data)
-                    except Exception as e:
-                        logger.warning(f"Error reading {json_file}: {e}")
-
-        # Paginate results
-        total_items = len(all_items)
+        # Totals come from the stored shard offsets; only the page's shards are read
+        job_dir = path_utils.get_job_dir(job_id)
+        shard_offsets = job_metadata.results_summary.get("shard_offsets")
+        if shard_offsets is None:
+            shard_offsets = await asyncio.to_thread(
+                scan_shard_offsets, job_dir, job_metadata.json_results_files()
+            )
+
+        total_items = sum(shard["count"] for shard in shard_offsets)
         total_pages = max(1, (total_items + page_size - 1) // page_size)
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
-        items = all_items[start_idx:end_idx]
+        items = await asyncio.to_thread(
+            read_results_page, job_dir, shard_offsets, start_idx, end_idx
+        )
 
-        return JobResultsResponse(
-            job_id=job_id,
-            status=job_metadata.status.value,
-            total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            items=items,
+        # Items come straight from our own results files; skip model validation
+        return Response(
+            content=orjson.dumps(
+                {
+                    "job_id": job_id,
+                    "status": job_metadata.status.value,
+                    "total_items": total_items,
+                    "page": page,
+                    "page_size": page_size,
+                    "total_pages": total_pages,
+                    "items": items,
+                }
+            ),
+            media_type="application/json",
         )
 
     @app.get("/api/v1/jobs", tags=["Jobs"])
@@ -195,55 +289,192 @@ def create_app() -> FastAPI:
         page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
     ) -> dict[str, Any]:
         """List all jobs with optional status filter."""
-        job_ids = path_utils.list_jobs()
-        jobs: list[dict[str, Any]] = []
-
-        for job_id in job_ids:
-            try:
-                metadata_path = path_utils.get_job_metadata_path(job_id)
-                if metadata_path.exists():
-                    job_metadata = JobMetadata.load(metadata_path)
-                    if status is None or job_metadata.status.value == status:
-                        jobs.append(job_metadata.to_dict())
-            except Exception as e:
-                logger.warning(f"Error loading job {job_id}: {e}")
-
-        # Sort by created_at descending
-        jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-        # Paginate
-        total_jobs = len(jobs)
+        job_index = app.state.job_index
+        total_jobs = await asyncio.to_thread(job_index.count, status)
         total_pages = max(1, (total_jobs + page_size - 1) // page_size)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
+        jobs = await asyncio.to_thread(
+            job_index.list_jobs, status, limit=page_size, offset=(page - 1) * page_size
+        )
 
         return {
             "total_jobs": total_jobs,
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages,
-            "jobs": jobs[start_idx:end_idx],
+            "jobs": jobs,
         }
 
     @app.delete("/api/v1/jobs/{job_id}", tags=["Jobs"])
     async def delete_job(job_id: str) -> dict[str, str]:
         """Delete a job and its files."""
-        job_dir = path_utils.get_job_dir(job_id)
-
-        if not job_dir.exists():
+        # Move the job aside now; the trash reaper removes the files later
+        try:
+            await asyncio.to_thread(trash_job, job_id, path_utils, app.state.job_index)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        import shutil
-        shutil.rmtree(job_dir)
-
         return {"message": f"Job {job_id} deleted successfully"}
 
     return app
 
 
+@contextmanager
+def _lock_file(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``lock_path``, waiting for other processes.
+
+    Args:
+        lock_path: Lock file; created if missing.
+    """
+    os.makedirs(lock_path.parent, exist_ok=True)
+    with open(lock_path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _try_lock_file(lock_path: Path) -> Optional[TextIO]:
+    """Take an exclusive lock on ``lock_path`` if no other process holds it.
+
+    Args:
+        lock_path: Lock file; created if missing.
+
+    Returns:
+        The open lock file, which holds the lock until closed, or None if
+        another process already has it.
+    """
+    os.makedirs(lock_path.parent, exist_ok=True)
+    f = open(lock_path, "a")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        f.close()
+        return None
+    return f
+
+
+def load_job_metadata(metadata_path: Path) -> Optional[JobMetadata]:
+    """Load a job's metadata.
+
+    Args:
+        metadata_path: Path to the job metadata JSON file.
+
+    Returns:
+        The job metadata, or None if the job doesn't exist.
+    """
+    try:
+        return JobMetadata.load(metadata_path)
+    except FileNotFoundError:
+        return None
+
+
+def persist_new_job(
+    job_metadata: JobMetadata, path_utils: PathUtils, job_index: JobIndex
+) -> None:
+    """Create a new job's directories and save its initial metadata.
+
+    Args:
+        job_metadata: The new job's metadata.
+        path_utils: Path utilities instance.
+        job_index: Job index to register the job in.
+    """
+    path_utils.ensure_job_dirs(job_metadata.job_id)
+    job_metadata.save(
+        path_utils.get_job_metadata_path(job_metadata.job_id), index=job_index
+    )
+
+
+def trash_job(job_id: str, path_utils: PathUtils, job_index: JobIndex) -> None:
+    """Move a job's directory to the trash and drop it from the index.
+
+    Args:
+        job_id: The job identifier.
+        path_utils: Path utilities instance.
+        job_index: Job index to remove the job from.
+
+    Raises:
+        FileNotFoundError: If the job doesn't exist.
+    """
+    trash_dir = path_utils.get_trash_dir()
+    os.makedirs(trash_dir, exist_ok=True)
+    # A rename is a single syscall, however many files the job has
+    os.rename(path_utils.get_job_dir(job_id), trash_dir / f"{job_id}-{uuid4()}")
+    job_index.delete(job_id)
+
+
+def save_job_if_present(
+    job_metadata: JobMetadata, path_utils: PathUtils, job_index: JobIndex
+) -> bool:
+    """Save a job's metadata unless the job has been deleted.
+
+    Args:
+        job_metadata: The job's metadata.
+        path_utils: Path utilities instance.
+        job_index: Job index to update alongside the file.
+
+    Returns:
+        True if the metadata was saved, False if the job directory is gone.
+    """
+    if not path_utils.get_job_dir(job_metadata.job_id).is_dir():
+        return False
+    job_metadata.save(
+        path_utils.get_job_metadata_path(job_metadata.job_id), index=job_index
+    )
+    return True
+
+
+async def _trash_reaper(trash_dir: Path) -> None:
+    """Periodically remove deleted jobs from the trash directory.
+
+    Args:
+        trash_dir: Directory deleted jobs are moved to.
+    """
+    while True:
+        try:
+            with os.scandir(trash_dir) as entries:
+                paths = [entry.path for entry in entries]
+        except FileNotFoundError:
+            paths = []
+
+        for path in paths:
+            await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+
+        await asyncio.sleep(TRASH_REAP_INTERVAL)
+
+
+def sync_job_index(job_index: JobIndex, path_utils: PathUtils) -> None:
+    """Index every job directory that has a metadata file.
+
+    Args:
+        job_index: The job index to populate.
+        path_utils: Path utilities locating the job directories.
+    """
+    for job_id in path_utils.list_jobs():
+        metadata_path = path_utils.get_job_metadata_path(job_id)
+        if not metadata_path.exists():
+            continue
+        try:
+            job_index.upsert(JobMetadata.load(metadata_path).to_dict())
+        except Exception as e:
+            logger.warning(f"Error indexing job {job_id}: {e}")
+
+
+async def _job_worker(job_queue: "asyncio.Queue[tuple[Any, ...]]") -> None:
+    """Run queued scraper jobs one at a time until cancelled."""
+    while True:
+        job_args = await job_queue.get()
+        try:
+            await run_scraper_job(*job_args)
+        finally:
+            job_queue.task_done()
+
+
 async def run_scraper_job(
     job_metadata: JobMetadata,
     path_utils: PathUtils,
+    job_index: JobIndex,
+    scraper_pool: Executor,
     query: str,
     brand: Optional[str],
     max_products: int,
@@ -252,9 +483,13 @@ async def run_scraper_job(
     """Run a scraper job in the background."""
     try:
         job_metadata.update_status(JobStatus.RUNNING)
-        job_metadata.save(path_utils.get_job_metadata_path(job_metadata.job_id))
+        if not await asyncio.to_thread(
+            save_job_if_present, job_metadata, path_utils, job_index
+        ):
+            logger.info(f"Job {job_metadata.job_id} was deleted before it started")
+            return
 
-        # Create scraper instance with config
+        # Scraper config
         config = {
             "keyword": query,
             "brand": brand,
@@ -262,26 +497,21 @@ async def run_scraper_job(
             "max_pages": pages,
             "delay": 1.0,
         }
-        scraper = TokopediaGraphQLScraper(config)
 
         logger.info(f"Starting scrape for query: {query}")
 
-        # Execute the scraping (synchronous method)
-        results = scraper.scrape_products()
+        # Execute the scraping in the worker pool so the event loop stays free
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(scraper_pool, scrape_sync, config)
 
-        # Save JSON results
+        # Save JSON and CSV results; the writers are independent, so overlap them
         json_dir = path_utils.get_job_json_dir(job_metadata.job_id)
-        results_file = json_dir / "results.json"
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2)
-
-        job_metadata.add_output_file("json/results.json")
-
-        # Save CSV results
-        csv_dir = path_utils.get_job_csv_dir(job_metadata.job_id)
-        csv_file = csv_dir / "results.csv"
-        csv_writer = TokopediaCSVWriter(csv_file)
-        csv_writer.write_products(results)
+        csv_file = path_utils.get_job_csv_dir(job_metadata.job_id) / "results.csv"
+        shard_offsets, _ = await asyncio.gather(
+            asyncio.to_thread(write_json_results, json_dir, results),
+            asyncio.to_thread(TokopediaCSVWriter(csv_file).write_products, results),
+        )
+        job_metadata.set_results_file("json/results.json")
         job_metadata.add_output_file("csv/results.csv")
 
         logger.info(f"Saved {len(results)} products to JSON and CSV")
@@ -292,6 +522,7 @@ async def run_scraper_job(
             brand=brand,
             max_products=max_products,
             pages=pages,
+            shard_offsets=shard_offsets,
         )
         job_metadata.update_status(JobStatus.COMPLETED)
         logger.info(f"Job {job_metadata.job_id} completed with {len(results)} results")
@@ -299,13 +530,124 @@ async def run_scraper_job(
     except asyncio.CancelledError:
         job_metadata.update_status(JobStatus.CANCELLED, error_message="Job was cancelled")
         logger.info(f"Job {job_metadata.job_id} was cancelled")
+        raise
 
     except Exception as e:
         job_metadata.update_status(JobStatus.FAILED, error_message=str(e))
         logger.exception(f"Job {job_metadata.job_id} failed")
 
     finally:
-        job_metadata.save(path_utils.get_job_metadata_path(job_metadata.job_id))
+        # A job deleted while it ran is already in the trash; don't bring it back
+        await asyncio.to_thread(save_job_if_present, job_metadata, path_utils, job_index)
+
+
+def write_json_results(json_dir: Path, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Write a job's results file.
+
+    Args:
+        json_dir: The job's JSON directory.
+        results: Scraped products.
+
+    Returns:
+        Shard offsets describing the written file.
+    """
+    with open(json_dir / "results.json", "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+
+    return build_shard_offsets([("json/results.json", len(results))])
+
+
+def build_shard_offsets(shards: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    """Build the shard offsets stored in a job's results summary.
+
+    Args:
+        shards: ``(file path relative to the job directory, item count)`` pairs
+            in result order.
+
+    Returns:
+        One ``{"file", "start", "count"}`` entry per shard.
+    """
+    entries: list[dict[str, Any]] = []
+    offset = 0
+    for file_name, count in shards:
+        entries.append({"file": file_name, "start": offset, "count": count})
+        offset += count
+    return entries
+
+
+def scan_shard_offsets(job_dir: Path, results_files: list[str]) -> list[dict[str, Any]]:
+    """Build shard offsets for jobs saved before they were stored in metadata.
+
+    Args:
+        job_dir: The job's directory.
+        results_files: The job's results files (relative to ``job_dir``).
+
+    Returns:
+        Shard offsets for the readable results files.
+    """
+    shards: list[dict[str, Any]] = []
+    offset = 0
+
+    for results_file in results_files:
+        try:
+            with open(job_dir / results_file, "rb") as f:
+                data = orjson.loads(f.read())
+        except Exception as e:
+            logger.warning(f"Error reading {job_dir / results_file}: {e}")
+            continue
+
+        if isinstance(data, list):
+            shard = {"file": results_file, "start": offset, "count": len(data)}
+        elif isinstance(data, dict):
+            shard = {"file": results_file, "start": offset, "count": 1, "prefix": ""}
+        else:
+            continue
+
+        shards.append(shard)
+        offset += shard["count"]
+
+    return shards
+
+
+def read_results_page(
+    job_dir: Path, shard_offsets: list[dict[str, Any]], start: int, stop: int
+) -> list[dict[str, Any]]:
+    """Stream the items in ``[start, stop)`` from the overlapping shards.
+
+    Args:
+        job_dir: The job's directory.
+        shard_offsets: The job's shard offsets.
+        start: Global index of the first item.
+        stop: Global index one past the last item.
+
+    Returns:
+        The items of the requested window.
+    """
+    items: list[dict[str, Any]] = []
+
+    for shard in shard_offsets:
+        shard_start = shard["start"]
+        shard_stop = shard_start + shard["count"]
+        if shard_stop <= start or shard_start >= stop:
+            continue
+
+        shard_file = job_dir / shard["file"]
+        try:
+            with open(shard_file, "rb") as f:
+                shard_items = ijson.items(
+                    f, shard.get("prefix", "item"), use_float=True
+                )
+                items.extend(
+                    islice(
+                        shard_items,
+                        max(start - shard_start, 0),
+                        min(stop, shard_stop) - shard_start,
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"Error reading {shard_file}: {e}")
+
+    return items
 
 
 # Create the app instance
@@ -316,4 +658,14 @@ if __name__ == "__main__":
     import uvicorn
 
     config = Config.from_env()
-    uvicorn.run(app, host=config.host, port=config.port)
+    # Job state lives on disk and in the SQLite index, so workers share it;
+    # the scrape and queue limits are split between them.
+    # uvloop and httptools ship with uvicorn[standard].
+    uvicorn.run(
+        "api.main:app",
+        host=config.host,
+        port=config.port,
+        workers=config.workers,
+        loop="uvloop",
+        http="httptools",
+    )
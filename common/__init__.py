@@ -1,8 +1,9 @@
 """Common utilities for tokopedia-scraper."""
 
 from .config import Config
+from .job_index import JobIndex
 from .job_metadata import JobMetadata, JobStatus
 from .logger import get_logger
 from .path_utils import PathUtils
 
-__all__ = ["Config", "JobMetadata", "JobStatus", "get_logger", "PathUtils"]
+__all__ = ["Config", "JobIndex", "JobMetadata", "JobStatus", "get_logger", "PathUtils"]
@@ -2,13 +2,17 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 
+# Parse .env once per process rather than on every from_env() call
+load_dotenv()
 
-@dataclass
+
+@dataclass(frozen=True)
 class Config:
     """Configuration for the Tokopedia Scraper."""
 
@@ -16,6 +20,7 @@ class Config:
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    workers: int = 1
 
     # Paths
     base_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
@@ -26,23 +31,39 @@ class Config:
     default_pages: int = 5
     timeout: int = 30
 
+    # Worker settings
+    thread_pool_size: int = 32
+    max_concurrent_scrapes: int = 2
+    max_queued_jobs: int = 0  # 0 means unbounded
+
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "Config":
-        """Load configuration from environment variables."""
-        load_dotenv()
+        """Load configuration from environment variables.
 
+        The result is cached; the returned instance is shared and immutable.
+        """
         base_dir = Path(__file__).parent.parent
         results_dir = base_dir / "results"
 
+        # Every uvicorn worker runs at least one scrape at a time, so more
+        # workers than the scrape cap would exceed it; clamp them to the cap
+        max_concurrent_scrapes = int(os.getenv("MAX_CONCURRENT_SCRAPES", "2"))
+        workers = min(int(os.getenv("WORKERS", "1")), max(max_concurrent_scrapes, 1))
+
         return cls(
             host=os.getenv("HOST", "0.0.0.0"),
             port=int(os.getenv("PORT", "8000")),
             debug=os.getenv("DEBUG", "false").lower() == "true",
+            workers=workers,
             base_dir=base_dir,
             results_dir=results_dir,
             default_max_products=int(os.getenv("DEFAULT_MAX_PRODUCTS", "100")),
             default_pages=int(os.getenv("DEFAULT_PAGES", "5")),
             timeout=int(os.getenv("TIMEOUT", "30")),
+            thread_pool_size=int(os.getenv("THREAD_POOL_SIZE", "32")),
+            max_concurrent_scrapes=max_concurrent_scrapes,
+            max_queued_jobs=int(os.getenv("MAX_QUEUED_JOBS", "0")),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -51,9 +72,13 @@ class Config:
             "host": self.host,
             "port": self.port,
             "debug": self.debug,
+            "workers": self.workers,
             "base_dir": str(self.base_dir),
             "results_dir": str(self.results_dir),
             "default_max_products": self.default_max_products,
             "default_pages": self.default_pages,
             "timeout": self.timeout,
+            "thread_pool_size": self.thread_pool_size,
+            "max_concurrent_scrapes": self.max_concurrent_scrapes,
+            "max_queued_jobs": self.max_queued_jobs,
         }
@@ -0,0 +1,113 @@
+"""SQLite-backed job index for tokopedia-scraper."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    metadata_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at
+    ON jobs (status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at
+    ON jobs (created_at DESC);
+"""
+
+
+class JobIndex:
+    """Index of job metadata used to list jobs without reading every job directory."""
+
+    def __init__(self, path: Path):
+        """Open (or create) the job index.
+
+        Args:
+            path: Path to the SQLite database file.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def upsert(self, metadata: dict[str, Any]) -> None:
+        """Insert or replace a job's entry.
+
+        Args:
+            metadata: Serialized job metadata (as returned by ``JobMetadata.to_dict``).
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs "
+                "(job_id, status, created_at, updated_at, metadata_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    metadata["job_id"],
+                    metadata["status"],
+                    metadata["created_at"],
+                    metadata["updated_at"],
+                    orjson.dumps(metadata).decode(),
+                ),
+            )
+
+    def delete(self, job_id: str) -> None:
+        """Remove a job's entry.
+
+        Args:
+            job_id: The job identifier.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Count indexed jobs.
+
+        Args:
+            status: Optional status filter.
+
+        Returns:
+            Number of matching jobs.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE (?1 IS NULL OR status = ?1)",
+                (status,),
+            ).fetchone()
+        return row[0]
+
+    def list_jobs(
+        self, status: Optional[str] = None, limit: int = 20, offset: int = 0
+    ) -> list[dict[str, Any]]:
+        """List jobs, newest first.
+
+        Args:
+            status: Optional status filter.
+            limit: Maximum number of jobs to return.
+            offset: Number of jobs to skip.
+
+        Returns:
+            List of serialized job metadata.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT metadata_json FROM jobs WHERE (?1 IS NULL OR status = ?1) "
+                "ORDER BY created_at DESC LIMIT ?2 OFFSET ?3",
+                (status, limit, offset),
+            ).fetchall()
+        return [orjson.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
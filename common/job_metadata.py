@@ -1,13 +1,30 @@
 """Job metadata management for tokopedia-scraper."""
 
-import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from uuid import uuid4
 
+import orjson
+
+from .job_index import JobIndex
+
+
+def _utc_now() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+@lru_cache(maxsize=1024)
+def _read_metadata_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a metadata file; cached per file revision."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
 
 class JobStatus(str, Enum):
     """Status of a scraping job."""
@@ -19,20 +36,21 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobMetadata:
     """Metadata for a scraping job."""
 
     job_id: str
     status: JobStatus = JobStatus.PENDING
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_utc_now)
+    updated_at: str = field(default_factory=_utc_now)
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
     parameters: dict[str, Any] = field(default_factory=dict)
     results_summary: dict[str, Any] = field(default_factory=dict)
     output_files: list[str] = field(default_factory=list)
+    results_file: Optional[str] = None
 
     @classmethod
     def create(cls, job_id: Optional[str] = None, **parameters: Any) -> "JobMetadata":
@@ -62,31 +80,46 @@ class JobMetadata:
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
-            json.JSONDecodeError: If the file is invalid JSON.
+            orjson.JSONDecodeError: If the file is invalid JSON.
         """
-        with open(path, "r") as f:
-            data = json.load(f)
+        # Keyed on mtime and size, so any rewrite of the file misses the cache
+        stat = os.stat(path)
+        data = dict(_read_metadata_file(str(path), stat.st_mtime_ns, stat.st_size))
 
         # Convert status string back to enum
         if isinstance(data.get("status"), str):
             data["status"] = JobStatus(data["status"])
 
+        # Copy containers so callers can't mutate the cached entry
+        for key in ("parameters", "results_summary"):
+            if key in data:
+                data[key] = dict(data[key])
+        if "output_files" in data:
+            data["output_files"] = list(data["output_files"])
+
         return cls(**data)
 
-    def save(self, path: Path) -> None:
+    def save(self, path: Path, index: Optional[JobIndex] = None) -> None:
         """Save job metadata to a file.
 
         Args:
             path: Path to save the metadata JSON file.
+            index: Optional job index to update alongside the file.
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = asdict(self)
-        # Convert enum to string for JSON serialization
-        data["status"] = self.status.value
+        data = self.to_dict()
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and rename so readers never see a partial file
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        if index is not None:
+            index.upsert(data)
 
     def update_status(self, status: JobStatus, error_message: Optional[str] = None) -> None:
         """Update job status.
@@ -96,7 +129,7 @@ class JobMetadata:
             error_message: Optional error message (for failed status).
         """
         self.status = status
-        self.updated_at = datetime.utcnow().isoformat()
+        self.updated_at = _utc_now()
 
         if status == JobStatus.RUNNING and self.started_at is None:
             self.started_at = self.updated_at
@@ -115,7 +148,27 @@ class JobMetadata:
         """
         if file_path not in self.output_files:
             self.output_files.append(file_path)
-            self.updated_at = datetime.utcnow().isoformat()
+            self.updated_at = _utc_now()
+
+    def set_results_file(self, file_path: str) -> None:
+        """Set the canonical results file and record it as an output.
+
+        Args:
+            file_path: Path to the results JSON file (relative to job directory).
+        """
+        self.results_file = file_path
+        self.add_output_file(file_path)
+
+    def json_results_files(self) -> list[str]:
+        """List the JSON files holding this job's results.
+
+        Returns:
+            The canonical results file, or the JSON output files of jobs
+            saved before ``results_file`` existed.
+        """
+        if self.results_file:
+            return [self.results_file]
+        return [f for f in self.output_files if f.endswith(".json")]
 
     def set_results_summary(self, **summary: Any) -> None:
         """Set the results summary.
@@ -124,14 +177,27 @@ class JobMetadata:
             **summary: Summary key-value pairs.
         """
         self.results_summary.update(summary)
-        self.updated_at = datetime.utcnow().isoformat()
+        self.updated_at = _utc_now()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary.
 
+        The containers are shared with this instance rather than deep-copied,
+        so serialize or copy the result before mutating the job again.
+
         Returns:
             Dictionary representation of the job metadata.
         """
-        data = asdict(self)
-        data["status"] = self.status.value
-        return data
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "error_message": self.error_message,
+            "parameters": self.parameters,
+            "results_summary": self.results_summary,
+            "output_files": self.output_files,
+            "results_file": self.results_file,
+        }
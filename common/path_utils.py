@@ -1,9 +1,17 @@
 """Path utilities for tokopedia-scraper."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=2048)
+def _job_path(jobs_dir: str, job_id: str, *parts: str) -> Path:
+    """Build (and cache) a path inside a job directory."""
+    return Path(os.path.join(jobs_dir, job_id, *parts))
+
+
 class PathUtils:
     """Utility class for managing scraper paths."""
 
@@ -19,6 +27,8 @@ class PathUtils:
             self.base_dir = base_dir
 
         self.results_dir = self.base_dir / "results"
+        self.jobs_dir = self.results_dir / "jobs"
+        self._jobs_dir_str = str(self.jobs_dir)
 
     def get_job_dir(self, job_id: str) -> Path:
         """Get the directory for a specific job.
@@ -29,7 +39,7 @@ class PathUtils:
         Returns:
             Path to the job directory.
         """
-        return self.results_dir / "jobs" / job_id
+        return _job_path(self._jobs_dir_str, job_id)
 
     def get_job_csv_dir(self, job_id: str) -> Path:
         """Get the CSV output directory for a job.
@@ -40,7 +50,7 @@ class PathUtils:
         Returns:
             Path to the job's CSV directory.
         """
-        return self.get_job_dir(job_id) / "csv"
+        return _job_path(self._jobs_dir_str, job_id, "csv")
 
     def get_job_json_dir(self, job_id: str) -> Path:
         """Get the JSON output directory for a job.
@@ -51,7 +61,7 @@ class PathUtils:
         Returns:
             Path to the job's JSON directory.
         """
-        return self.get_job_dir(job_id) / "json"
+        return _job_path(self._jobs_dir_str, job_id, "json")
 
     def ensure_job_dirs(self, job_id: str) -> dict[str, Path]:
         """Ensure all job directories exist.
@@ -68,8 +78,9 @@ class PathUtils:
             "json": self.get_job_json_dir(job_id),
         }
 
-        for path in dirs.values():
-            path.mkdir(parents=True, exist_ok=True)
+        # Creating the leaf dirs creates the shared job dir along the way
+        os.makedirs(dirs["csv"], exist_ok=True)
+        os.makedirs(dirs["json"], exist_ok=True)
 
         return dirs
 
@@ -82,7 +93,23 @@ class PathUtils:
         Returns:
             Path to the job metadata JSON file.
         """
-        return self.get_job_dir(job_id) / "job_metadata.json"
+        return _job_path(self._jobs_dir_str, job_id, "job_metadata.json")
+
+    def get_job_index_path(self) -> Path:
+        """Get the path to the job index database.
+
+        Returns:
+            Path to the SQLite job index.
+        """
+        return self.results_dir / "jobs.db"
+
+    def get_trash_dir(self) -> Path:
+        """Get the directory deleted jobs are moved to before removal.
+
+        Returns:
+            Path to the trash directory.
+        """
+        return self.results_dir / "trash"
 
     def list_jobs(self) -> list[str]:
         """List all job IDs.
@@ -90,8 +117,9 @@ class PathUtils:
         Returns:
             List of job IDs.
         """
-        jobs_dir = self.results_dir / "jobs"
-        if not jobs_dir.exists():
+        # DirEntry.is_dir uses the d_type from readdir, avoiding a stat per job
+        try:
+            with os.scandir(self.jobs_dir) as entries:
+                return [e.name for e in entries if e.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
             return []
-
-        return [d.name for d in jobs_dir.iterdir() if d.is_dir()]
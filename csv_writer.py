@@ -6,9 +6,62 @@ Writes scraped product data to CSV format matching the unified template.
 """
 
 import csv
+import io
+import itertools
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Large enough that a typical results CSV goes out in a handful of write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Scratch buffers larger than this aren't kept around for reuse
+MAX_SCRATCH_SIZE = 128 << 10
+
+# Per-thread buffer reused to build each CSV in memory before one write
+_scratch = threading.local()
+
+# Strips everything but digits and separators from a price string
+_PRICE_STRIP = re.compile(r"[^\d,.]")
+
+# Strips the currency prefix, thousands dots and spaces from "Rp1.246.072"
+_RUPIAH_STRIP = str.maketrans("", "", "Rp. ")
+
+# Turns "1.246,07" into "1246.07" in one pass
+_EUROPEAN_TO_PLAIN = str.maketrans({".": None, ",": "."})
+
+
+@lru_cache(maxsize=4096)
+def _parse_price(price_str: str) -> str:
+    """Parse a non-empty price string; cached since listings repeat prices."""
+    # Fast path for the usual Indonesian format (Rp1.246.072)
+    if price_str.startswith("Rp") and "," not in price_str:
+        digits = price_str.translate(_RUPIAH_STRIP)
+        if digits.isdecimal():
+            return str(float(digits))
+
+    # Remove currency symbols and spaces
+    price_clean = _PRICE_STRIP.sub("", price_str)
+
+    # Handle Indonesian number format (dots as thousands separator)
+    if "." in price_clean and "," not in price_clean:
+        # Likely Indonesian format: 1.246.072
+        price_clean = price_clean.replace(".", "")
+    elif "," in price_clean:
+        # Could be: 1,246.07 or 1.246,07
+        # If last separator is comma, it's European format
+        # (stripping trailing digits leaves the last separator at the end)
+        if price_clean.rstrip("0123456789").endswith(","):
+            price_clean = price_clean.translate(_EUROPEAN_TO_PLAIN)
+        else:
+            price_clean = price_clean.replace(",", "")
+
+    try:
+        return str(float(price_clean))
+    except ValueError:
+        return price_clean
 
 
 class TokopediaCSVWriter:
@@ -56,17 +109,57 @@ class TokopediaCSVWriter:
         Returns:
             Number of products written
         """
-        with open(self.output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.HEADERS)
-            writer.writeheader()
+        # Take the buffer out while in use; it's only returned after a clean write
+        buf = _scratch.__dict__.pop("buf", None) or io.BytesIO()
+        buf.seek(0)
+        buf.truncate()
+
+        # Render the whole CSV into the scratch buffer, then write it out at once
+        text = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(self.HEADERS)
+        if products:
+            # Build all rows up front so writerows gets one prebuilt list
+            format_product = self._format_product
+            rows = [format_product(product) for product in products]
+            writer.writerows(rows)
+        text.flush()
+        text.detach()
+
+        with open(self.output_path, "wb") as f, buf.getbuffer() as view:
+            f.write(view)
+
+        if buf.tell() <= MAX_SCRATCH_SIZE:
+            _scratch.buf = buf
+        return len(products)
 
-            for product in products:
-                row = self._format_product(product)
-                writer.writerow(row)
+    def write_products_iter(self, products: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write products to CSV file as they are produced.
 
-        return len(products)
+        Unlike write_products, this never holds more than one product in
+        memory, so it suits results streamed from a large JSON file.
+
+        Args:
+            products: Iterable of product dictionaries from the scraper
 
-    def _format_product(self, product: Dict[str, Any]) -> Dict[str, str]:
+        Returns:
+            Number of products written
+        """
+        # zip stops at the end of products, so the counter ends at the row count
+        counter = itertools.count()
+        format_product = self._format_product
+
+        with open(
+            self.output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.HEADERS)
+            writer.writerows(format_product(product) for product, _ in zip(products, counter))
+
+        return next(counter)
+
+    def _format_product(self, product: Dict[str, Any]) -> Tuple[str, ...]:
         """
         Format a product dictionary to match CSV schema.
 
@@ -74,31 +167,35 @@ class TokopediaCSVWriter:
             product: Raw product data from scraper
 
         Returns:
-            Formatted row dictionary
+            Formatted row, in HEADERS order
         """
+        # Bind once; this runs for every product
+        get = product.get
+
         # Extract and format price (remove currency symbols)
-        price = self._extract_price(product.get("Sale Price", ""))
-
-        return {
-            "Listing Title*": product.get("Title", ""),
-            "Listings URL*": product.get("Product URL", ""),
-            "Image URL*": product.get("Image URL", ""),
-            "Marketplace*": "Tokopedia",
-            "Price*": price,
-            "Shipping": "",  # Not available in current data
-            "Units Available": "",  # Not available in current data
-            "Item Number": product.get("Product ID", ""),
-            "Brand": product.get("Brand", ""),
-            "ASIN": "",  # Not applicable for Tokopedia
-            "UPC": "",  # Not available
-            "Walmart ID": "",  # Not applicable
-            "Seller's Name*": product.get("Store Name", ""),
-            "Seller's URL*": product.get("Store URL", ""),
-            "Seller's Business Name": "",  # Not available in current data
-            "Seller's Address": product.get("Location", ""),
-            "Seller's Email": "",  # Not available
-            "Seller's Phone Number": "",  # Not available
-        }
+        price_str = get("Sale Price", "")
+        price = _parse_price(price_str) if price_str else ""
+
+        return (
+            get("Title", ""),  # Listing Title*
+            get("Product URL", ""),  # Listings URL*
+            get("Image URL", ""),  # Image URL*
+            "Tokopedia",  # Marketplace*
+            price,  # Price*
+            "",  # Shipping: not available in current data
+            "",  # Units Available: not available in current data
+            get("Product ID", ""),  # Item Number
+            get("Brand", ""),  # Brand
+            "",  # ASIN: not applicable for Tokopedia
+            "",  # UPC: not available
+            "",  # Walmart ID: not applicable
+            get("Store Name", ""),  # Seller's Name*
+            get("Store URL", ""),  # Seller's URL*
+            "",  # Seller's Business Name: not available in current data
+            get("Location", ""),  # Seller's Address
+            "",  # Seller's Email: not available
+            "",  # Seller's Phone Number: not available
+        )
 
     def _extract_price(self, price_str: str) -> str:
         """
@@ -113,23 +210,4 @@ class TokopediaCSVWriter:
         if not price_str:
             return ""
 
-        # Remove currency symbols and spaces
-        # Convert Indonesian format (Rp1.246.072) to number (1246072)
-        price_clean = re.sub(r"[^\d,.]", "", price_str)
-
-        # Handle Indonesian number format (dots as thousands separator)
-        if "." in price_clean and "," not in price_clean:
-            # Likely Indonesian format: 1.246.072
-            price_clean = price_clean.replace(".", "")
-        elif "," in price_clean:
-            # Could be: 1,246.07 or 1.246,07
-            # If last separator is comma, it's European format
-            if price_clean.rfind(",") > price_clean.rfind("."):
-                price_clean = price_clean.replace(".", "").replace(",", ".")
-            else:
-                price_clean = price_clean.replace(",", "")
-
-        try:
-            return str(float(price_clean))
-        except ValueError:
-            return price_clean
+        return _parse_price(price_str)
@@ -6,17 +6,29 @@ This script processes all existing job results and creates CSV files
 for jobs that only have JSON results.
 """
 
-import json
+import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Tuple
+
+import ijson
+import orjson
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from csv_writer import TokopediaCSVWriter
 
+# Results files larger than this are streamed rather than loaded whole
+STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Status lines are written to stdout in batches of this many jobs
+STATUS_BATCH_SIZE = 100
 
-def regenerate_csv_for_job(job_dir: Path) -> bool:
+
+def regenerate_csv_for_job(job_dir: Path) -> Tuple[bool, str]:
     """
     Regenerate CSV for a single job.
 
@@ -24,52 +36,72 @@ def regenerate_csv_for_job(job_dir: Path) -> bool:
         job_dir: Path to the job directory
 
     Returns:
-        True if CSV was generated successfully
+        Whether the CSV was generated, and a status line for the job
     """
     json_file = job_dir / "json" / "results.json"
     csv_file = job_dir / "csv" / "results.csv"
 
-    # Check if JSON file exists
-    if not json_file.exists():
-        print(f"⏭️  Skipping {job_dir.name} - no JSON file")
-        return False
-
     # Check if CSV already exists
-    if csv_file.exists():
-        print(f"⏭️  Skipping {job_dir.name} - CSV already exists")
-        return False
+    if os.path.lexists(csv_file):
+        return False, f"⏭️  Skipping {job_dir.name} - CSV already exists"
 
     try:
-        # Load JSON results
-        with open(json_file, "r") as f:
-            results = json.load(f)
-
-        if not results:
-            print(f"⚠️  Skipping {job_dir.name} - empty results")
-            return False
-
-        # Create CSV
-        csv_writer = TokopediaCSVWriter(csv_file)
-        count = csv_writer.write_products(results)
-
-        print(f"✅ Generated CSV for {job_dir.name} ({count} products)")
-        return True
+        # Load JSON results; opening directly saves a separate existence check
+        try:
+            f = open(json_file, "rb")
+        except FileNotFoundError:
+            return False, f"⏭️  Skipping {job_dir.name} - no JSON file"
+
+        with f:
+            if os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+                # Stream products straight into the CSV instead of materializing them
+                csv_writer = TokopediaCSVWriter(csv_file)
+                try:
+                    count = csv_writer.write_products_iter(
+                        ijson.items(f, "item", use_float=True)
+                    )
+                except BaseException:
+                    # Don't leave a partial CSV that later runs would skip over
+                    csv_file.unlink(missing_ok=True)
+                    raise
+                if not count:
+                    csv_file.unlink()
+            else:
+                results = orjson.loads(f.read())
+                count = 0
+                if results:
+                    csv_writer = TokopediaCSVWriter(csv_file)
+                    count = csv_writer.write_products(results)
+
+        if not count:
+            return False, f"⚠️  Skipping {job_dir.name} - empty results"
+
+        return True, f"✅ Generated CSV for {job_dir.name} ({count} products)"
 
     except Exception as e:
-        print(f"❌ Error processing {job_dir.name}: {e}")
-        return False
+        return False, f"❌ Error processing {job_dir.name}: {e}"
 
 
 def main():
     """Main function to regenerate all CSV files."""
+    parser = argparse.ArgumentParser(description="Regenerate CSV files for existing job results")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+
     results_dir = Path(__file__).parent / "results" / "jobs"
 
     if not results_dir.exists():
         print(f"❌ Results directory not found: {results_dir}")
         return
 
-    # Find all job directories
-    job_dirs = [d for d in results_dir.iterdir() if d.is_dir()]
+    # Find all job directories; DirEntry.is_dir avoids a stat per entry
+    with os.scandir(results_dir) as entries:
+        job_dirs = [Path(e.path) for e in sorted(entries, key=lambda e: e.name) if e.is_dir()]
 
     if not job_dirs:
         print("No job directories found")
@@ -78,10 +110,19 @@ def main():
     print(f"Found {len(job_dirs)} job directories")
     print("=" * 60)
 
+    # Jobs are independent and parsing is CPU-bound, so spread them over processes
     success_count = 0
-    for job_dir in sorted(job_dirs):
-        if regenerate_csv_for_job(job_dir):
-            success_count += 1
+    status_lines = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for generated, status_line in pool.map(regenerate_csv_for_job, job_dirs):
+            success_count += generated
+            status_lines.append(status_line)
+            if len(status_lines) >= STATUS_BATCH_SIZE:
+                sys.stdout.write("\n".join(status_lines) + "\n")
+                status_lines.clear()
+
+    if status_lines:
+        sys.stdout.write("\n".join(status_lines) + "\n")
 
     print("=" * 60)
     print(f"✅ Successfully generated {success_count} CSV files")
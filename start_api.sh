@@ -3,7 +3,7 @@
 Tokopedia Scraper API Server Startup Script
 ==========================================
 
-Starts the Tokopedia scraper REST API service on port 8002.
+Starts the Tokopedia scraper REST API service on port 8000.
 """
 
 # Install dependencies if needed
@@ -11,6 +11,6 @@ echo "Installing dependencies..."
 uv sync
 
 # Start the API server
-echo "Starting Tokopedia Scraper API on http://localhost:8002"
-echo "API Documentation available at http://localhost:8002/docs"
-uv run uvicorn api_service:app --host 0.0.0.0 --port 8002 --reload
+echo "Starting Tokopedia Scraper API on http://localhost:8000"
+echo "API Documentation available at http://localhost:8000/docs"
+uv run uvicorn api.main:app --host 0.0.0.0 --port 8000 --loop uvloop --reload
@@ -1,14 +1,71 @@
 """API tests for tokopedia-scraper."""
 
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from uuid import uuid4
+
 import pytest
-from api.main import app
+import api.main
+from api.main import build_shard_offsets, create_app
+from common.config import Config
+from common.job_metadata import JobMetadata, JobStatus
+from common.path_utils import PathUtils
 from fastapi.testclient import TestClient
 
 
+def _fake_scrape(config: dict[str, Any]) -> list[dict[str, Any]]:
+    """Stand-in for scrape_sync that returns no products without a request."""
+    return []
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Create an app whose jobs, index and trash live under tmp_path."""
+    config = Config(base_dir=tmp_path)
+    monkeypatch.setattr(Config, "from_env", classmethod(lambda cls: config))
+    monkeypatch.setattr(api.main, "scrape_sync", _fake_scrape)
+    return create_app()
+
+
 @pytest.fixture
-def client():
-    """Create a test client."""
-    return TestClient(app)
+def client(app):
+    """Create a test client with the app lifespan running."""
+    with TestClient(app) as client:
+        # Run the stubbed scrapes in a thread; a worker process would import
+        # the real scrape_sync instead of the stub
+        app.state.scraper_pool.shutdown()
+        app.state.scraper_pool = ThreadPoolExecutor(max_workers=1)
+        yield client
+
+
+@pytest.fixture
+def completed_job(app, client, tmp_path):
+    """Create a completed job with 25 results on disk."""
+    path_utils = PathUtils(tmp_path)
+    job_id = f"test-{uuid4()}"
+    dirs = path_utils.ensure_job_dirs(job_id)
+
+    results = [{"Product ID": str(i), "Title": f"Product {i}"} for i in range(25)]
+    with open(dirs["json"] / "results.json", "w") as f:
+        json.dump(results, f)
+
+    job_metadata = JobMetadata.create(job_id=job_id, query="smartphone")
+    job_metadata.set_results_file("json/results.json")
+    job_metadata.set_results_summary(
+        total_products=len(results),
+        shard_offsets=build_shard_offsets([("json/results.json", len(results))]),
+    )
+    job_metadata.update_status(JobStatus.COMPLETED)
+    job_metadata.save(path_utils.get_job_metadata_path(job_id), index=app.state.job_index)
+
+    return job_id
+
+
+def test_create_app_has_no_disk_side_effects(app, tmp_path):
+    """Test that the job index is only opened when the app starts."""
+    assert not (tmp_path / "results").exists()
 
 
 class TestHealthEndpoint:
@@ -61,6 +118,18 @@ class TestJobsEndpoint:
         response = client.post("/api/v1/jobs?query=smartphone&pages=100")
         assert response.status_code == 422  # Validation error (max 50)
 
+    def test_get_job_status(self, client, completed_job):
+        """Test getting the status of an existing job."""
+        response = client.get(f"/api/v1/jobs/{completed_job}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["job_id"] == completed_job
+        assert data["status"] == "completed"
+        assert data["output_files"] == ["json/results.json"]
+        # Internal bookkeeping stays out of the status response
+        assert "results_file" not in data
+        assert "shard_offsets" not in data["results_summary"]
+
     def test_get_nonexistent_job(self, client):
         """Test that getting a nonexistent job returns 404."""
         response = client.get("/api/v1/jobs/nonexistent-job-id")
@@ -99,6 +168,41 @@ class TestJobsEndpoint:
         assert data["page"] == 1
         assert data["page_size"] == 10
 
+    def test_list_jobs_includes_indexed_job(self, client, completed_job):
+        """Test that saved jobs are listed from the index with their metadata."""
+        response = client.get("/api/v1/jobs?status=completed&page_size=100")
+        assert response.status_code == 200
+        jobs = {job["job_id"]: job for job in response.json()["jobs"]}
+        assert jobs[completed_job]["status"] == "completed"
+        assert jobs[completed_job]["parameters"] == {"query": "smartphone"}
+
+    def test_delete_job_removes_from_listing(self, client, completed_job):
+        """Test that deleting a job removes it from the listing."""
+        response = client.delete(f"/api/v1/jobs/{completed_job}")
+        assert response.status_code == 200
+
+        response = client.get("/api/v1/jobs?page_size=100")
+        assert completed_job not in {job["job_id"] for job in response.json()["jobs"]}
+
+    def test_deleted_running_job_stays_deleted(self, app, client, tmp_path):
+        """Test that a job deleted mid-run isn't saved back when it finishes."""
+        path_utils = PathUtils(tmp_path)
+        job_index = app.state.job_index
+        job_metadata = JobMetadata.create(job_id=f"test-{uuid4()}", query="smartphone")
+        api.main.persist_new_job(job_metadata, path_utils, job_index)
+        api.main.trash_job(job_metadata.job_id, path_utils, job_index)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            asyncio.run(
+                api.main.run_scraper_job(
+                    job_metadata, path_utils, job_index, pool, "smartphone", None, 10, None
+                )
+            )
+
+        assert not path_utils.get_job_dir(job_metadata.job_id).exists()
+        response = client.get("/api/v1/jobs?page_size=100")
+        assert job_metadata.job_id not in {job["job_id"] for job in response.json()["jobs"]}
+
     def test_delete_nonexistent_job(self, client):
         """Test that deleting a nonexistent job returns 404."""
         response = client.delete("/api/v1/jobs/nonexistent-job-id")
@@ -124,6 +228,24 @@ class TestJobResults:
         response = client.get("/api/v1/jobs/test-job-id/results?page_size=10000")
         assert response.status_code == 422  # Validation error (max 1000)
 
+    def test_results_page_window(self, client, completed_job):
+        """Test that a page returns only its slice of the results."""
+        response = client.get(f"/api/v1/jobs/{completed_job}/results?page=3&page_size=10")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["total_items"] == 25
+        assert data["total_pages"] == 3
+        assert [item["Product ID"] for item in data["items"]] == [
+            str(i) for i in range(20, 25)
+        ]
+
+    def test_results_page_past_end(self, client, completed_job):
+        """Test that a page past the last result is empty."""
+        response = client.get(f"/api/v1/jobs/{completed_job}/results?page=4&page_size=10")
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,134 @@
+"""Price parsing tests for tokopedia-scraper."""
+
+import sys
+import types
+from typing import Any
+
+import pytest
+from csv_writer import TokopediaCSVWriter, _parse_price
+from tokopedia_graphql import TokopediaGraphQLScraper
+
+try:
+    import unified_csv_writer  # noqa: F401
+except ImportError:
+    # UnifiedCSVWriter lives outside this repository; the price helpers
+    # under test don't use it
+    sys.modules["unified_csv_writer"] = types.SimpleNamespace(UnifiedCSVWriter=object)
+
+from tokopedia_unified_formatter import TokopediaUnifiedFormatter, _extract_price
+
+
+def _graphql_prices(price: Any) -> tuple[str, str, int]:
+    """Format a GraphQL product with the given price block."""
+    scraper = TokopediaGraphQLScraper({})
+    product = scraper._format_product(
+        {"oldID": 1, "name": "Smartphone", "price": price}, "2024-01-01T00:00:00"
+    )
+    assert product is not None
+    return product["Sale Price"], product["Original Price"], product["Discount (%)"]
+
+
+class TestGraphQLPrices:
+    """Tests for the prices set by the GraphQL scraper's _format_product."""
+
+    def test_null_price_block(self):
+        """Test that a missing price block gives empty prices."""
+        assert _graphql_prices(None) == ("", "", 0)
+
+    def test_null_price_fields(self):
+        """Test that null price fields give empty prices."""
+        price = {"text": None, "original": None, "discountPercentage": None}
+        assert _graphql_prices(price) == ("", "", 0)
+
+    def test_empty_price_fields(self):
+        """Test that empty price fields give empty prices."""
+        price = {"text": "", "original": "", "discountPercentage": 0}
+        assert _graphql_prices(price) == ("", "", 0)
+
+    def test_rupiah_price(self):
+        """Test that the original price falls back to the sale price."""
+        price = {"text": "Rp1.234.567", "original": "", "discountPercentage": 0}
+        assert _graphql_prices(price) == ("Rp1.234.567", "Rp1.234.567", 0)
+
+    def test_discounted_price(self):
+        """Test that a discounted product keeps both prices and the discount."""
+        price = {"text": "Rp999.000", "original": "Rp1.234.567", "discountPercentage": 19}
+        assert _graphql_prices(price) == ("Rp999.000", "Rp1.234.567", 19)
+
+    def test_non_numeric_price(self):
+        """Test that non-numeric price text is passed through as is."""
+        price = {"text": "Hubungi penjual", "original": "", "discountPercentage": 0}
+        assert _graphql_prices(price) == ("Hubungi penjual", "Hubungi penjual", 0)
+
+
+class TestCSVPrices:
+    """Tests for the CSV writer's price parsing."""
+
+    @pytest.mark.parametrize("price", [None, ""])
+    def test_missing_price(self, tmp_path, price):
+        """Test that a null or empty sale price leaves the Price* column empty."""
+        writer = TokopediaCSVWriter(tmp_path / "results.csv")
+        row = writer._format_product({"Sale Price": price})
+        assert row[TokopediaCSVWriter.HEADERS.index("Price*")] == ""
+        assert writer._extract_price(price) == ""
+
+    @pytest.mark.parametrize(
+        ("price", "expected"),
+        [
+            ("Rp1.234.567", "1234567.0"),
+            ("Rp 1.234.567", "1234567.0"),
+            ("1.234,50", "1234.5"),
+            ("1,234.50", "1234.5"),
+        ],
+    )
+    def test_parse_price(self, price, expected):
+        """Test Rupiah, European and US formatted prices."""
+        assert _parse_price(price) == expected
+
+    def test_discounted_price(self, tmp_path):
+        """Test that the Price* column uses the discounted sale price."""
+        writer = TokopediaCSVWriter(tmp_path / "results.csv")
+        row = writer._format_product(
+            {"Sale Price": "Rp999.000", "Original Price": "Rp1.234.567", "Discount (%)": 19}
+        )
+        assert row[TokopediaCSVWriter.HEADERS.index("Price*")] == "999000.0"
+
+    def test_non_numeric_price(self):
+        """Test that a price without digits parses to an empty string."""
+        assert _parse_price("Hubungi penjual") == ""
+
+
+class TestUnifiedPrices:
+    """Tests for the unified formatter's price extraction."""
+
+    @pytest.mark.parametrize("price", [None, ""])
+    def test_missing_price(self, price):
+        """Test that a null or empty price becomes "0"."""
+        unified = TokopediaUnifiedFormatter().format_product_to_unified({"price": price})
+        assert unified["price"] == "0"
+
+    @pytest.mark.parametrize(
+        ("price", "expected"),
+        [
+            ("Rp1.234.567", "1.234.567"),
+            ("Rp 1.234.567", "1.234.567"),
+            ("IDR 299,000", "299,000"),
+            ("1234567", "1234567"),
+        ],
+    )
+    def test_extract_price(self, price, expected):
+        """Test that the number is taken from prefixed and plain prices."""
+        assert _extract_price(price) == expected
+
+    def test_int_price(self):
+        """Test that whole-number prices are used as they are."""
+        unified = TokopediaUnifiedFormatter().format_product_to_unified({"price": 1234567})
+        assert unified["price"] == "1234567"
+
+    def test_discounted_price(self):
+        """Test that the first (discounted) price is taken from a price range."""
+        assert _extract_price("Rp999.000 Rp1.234.567") == "999.000"
+
+    def test_non_numeric_price(self):
+        """Test that a price without digits becomes "0"."""
+        assert _extract_price("Hubungi penjual") == "0"
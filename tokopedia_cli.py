@@ -2,91 +2,417 @@
 """
 Tokopedia CLI Scraper - Simplified Version
 
-A command-line tool to scrape product information from Tokopedia.com with
-infinite scrolling when no --max-pages is specified.
+A command-line tool to scrape product information from Tokopedia.com. Products
+come from Tokopedia's GraphQL search API; with --browser (or when the API
+returns nothing) pages are rendered with Playwright, scrolling infinitely when
+no --max-pages is specified.
 
 Usage:
     python tokopedia_cli.py -k "smartphone" -b "iPhone"
     python tokopedia_cli.py -k "smartphone" -b "iPhone" --max-pages 3
+    python tokopedia_cli.py -k "smartphone" -b "iPhone" --browser
+    python tokopedia_cli.py -k "laptop" -k "tablet" -b "Apple" --browser
     python tokopedia_cli.py -k "laptop" -b "MacBook" --delay 3.0
 """
 
 import argparse
 import asyncio
-import json
 import os
 import re
 import sys
 import time
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, BinaryIO
 from urllib.parse import quote, urljoin
 
-from crawlee.crawlers import PlaywrightCrawler, PlaywrightCrawlingContext
+import orjson
+from crawlee import ConcurrencySettings
+from crawlee.crawlers import (
+    PlaywrightCrawler,
+    PlaywrightCrawlingContext,
+    PlaywrightPreNavCrawlingContext,
+)
 from playwright.async_api import Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from tokopedia_graphql import TokopediaGraphQLScraper
+
+# Common Tokopedia product URL patterns, tried in order
+PRODUCT_ID_PATTERNS: list[re.Pattern[str]] = [
+    re.compile(r"extParam[^&]*search_id%3D([A-Z0-9]+)"),  # From extParam
+    re.compile(r"-(\d{13,})"),  # Long numeric ID (13+ digits)
+    re.compile(r"/([^/?]+)\?"),  # Product slug before query params
+    re.compile(r"/([^/?]+)$"),  # Product slug at end
+]
+
+# Everything except digits, dots, and commas
+PRICE_STRIP_PATTERN: re.Pattern[str] = re.compile(r"[^\d.,]")
+
+# Store name from URL pattern: tokopedia.com/storename/product
+STORE_URL_PATTERN: re.Pattern[str] = re.compile(r"tokopedia\.com/([^/?]+)")
+
+# First path segments of tokopedia.com URLs that aren't stores
+NON_STORE_SLUGS: frozenset[str] = frozenset(
+    {"p", "discovery", "help", "about", "careers", "search"}
+)
+
+# Marks a lone store info text as a location rather than a store name
+LOCATION_PATTERN: re.Pattern[str] = re.compile(r"Jakarta|Surabaya|Bandung|Kab\.|Kota")
+
+# A single word, the unit of translation
+WORD_PATTERN: re.Pattern[str] = re.compile(r"\b\w+\b")
+
+# Trackers and ad scripts blocked on top of crawlee's default asset patterns
+# (stylesheets, images, fonts); the scraper only reads DOM text and attributes
+BLOCKED_URL_PATTERNS: list[str] = [
+    "googletagmanager",
+    "google-analytics",
+    "doubleclick",
+    "facebook.net",
+    "moengage",
+    "criteo",
+    "adsbygoogle.js",
+]
+
+# Chromium flags for a scraper that only reads DOM text: no GPU, no /dev/shm
+# buffers, no image decoding, and no throttling of background tabs
+BROWSER_ARGS: list[str] = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# A small viewport keeps layout cheap; cards still load as the page scrolls
+BROWSER_VIEWPORT: dict[str, int] = {"width": 800, "height": 600}
+
+# Browser tabs crawled at once; Tokopedia throttles heavier use per IP
+MAX_CONCURRENT_PAGES: int = 4
+
+# Product cards on category and search pages respectively
+PRODUCT_CARD_SELECTOR: str = (
+    'div[data-testid="divProductWrapper"], a[data-testid="lnkProductContainer"]'
+)
+
+# How long to wait for product cards to render, in milliseconds
+PRODUCT_WAIT_TIMEOUT: int = 8000
+
+# Product container selectors, tried in order until one matches
+CONTAINER_SELECTORS: list[str] = [
+    'div[data-testid="divProductWrapper"]',
+    'a[data-testid="lnkProductContainer"]',
+    # Search page selectors
+    '[data-testid*="product"], [data-testid*="Product"]',
+    # CSS class based selectors
+    '.prd_container-card, .css-bk6tzz, .css-5wh65g, [class*="product"]',
+]
+
+TITLE_SELECTORS: list[str] = [
+    ".css-20kt3o",  # Primary title class (category pages)
+    'span[data-testid*="spnSRPProdName"]',  # Search result product name
+    'span[data-testid*="title"]',
+    'span[data-testid*="name"]',
+    'div[data-testid*="title"]',
+    'span[class*="title"]',
+    'span[class*="name"]',
+    'span[class*="prd_link-prod-name"]',  # Search page product name
+    ".css-3017qm",  # Alternative title class
+    'span[data-unify="Typography"]',  # Typography component
+    "h3",
+    "h4",
+    "h5",  # Generic headings
+    "a[title]",  # Links with title attribute
+    '[class*="name"]',
+    '[class*="title"]',  # Generic class patterns
+]
+
+PRICE_SELECTORS: list[str] = [
+    ".css-o5uqvq",  # Primary price class (category pages)
+    'span[data-testid*="spnSRPProdPrice"]',  # Search result price
+    'span[class*="price"]',
+    'div[class*="price"]',
+    'span:has-text("Rp")',
+    'div:has-text("Rp")',
+    ".css-h66vau",  # Alternative price class
+    ".prd_link-prod-price",  # Search page price class
+    '[class*="price"]',  # Generic price pattern
+    'span[data-unify="Typography"]:has-text("Rp")',  # Typography with Rp
+]
+
+STORE_INFO_SELECTORS: list[str] = [
+    ".css-ywdpwd",  # Store info class
+    'span[data-testid*="spnSRPProdTablet"]',
+    'span[class*="shop"]',
+    'div[class*="shop"]',
+    'span[class*="store"]',
+    'div[class*="store"]',
+]
+
+# Reads the raw fields of every product card past `start` in one browser
+# round-trip, and reports which container selector matched. Selectors ending
+# in :has-text("...") are Playwright-only, so they are emulated with a
+# case-insensitive textContent check.
+EXTRACT_PRODUCTS_JS: str = """
+({
+    containerSelectors,
+    titleSelectors,
+    priceSelectors,
+    storeSelectors,
+    titleSelector,
+    priceSelector,
+    start,
+}) => {
+    const query = (root, selector) => {
+        const hasText = selector.match(/^(.*):has-text\\("(.*)"\\)$/);
+        if (!hasText) {
+            return Array.from(root.querySelectorAll(selector));
+        }
+        const needle = hasText[2].toLowerCase();
+        return Array.from(root.querySelectorAll(hasText[1])).filter(
+            (el) => el.textContent.toLowerCase().includes(needle)
+        );
+    };
+
+    const tryMatch = (root, selector, accept) => {
+        try {
+            const el = query(root, selector)[0];
+            return el ? accept(el) : "";
+        } catch (e) {
+            return "";
+        }
+    };
+
+    // Card layout is stable within a page, so the selector that last produced
+    // a value is tried first and the full list is only walked on a miss
+    const matcher = (selectors, accept, winner) => ({
+        winner: winner,
+        match(root) {
+            if (this.winner) {
+                const value = tryMatch(root, this.winner, accept);
+                if (value) {
+                    return value;
+                }
+            }
+            for (const selector of selectors) {
+                if (selector === this.winner) {
+                    continue;
+                }
+                const value = tryMatch(root, selector, accept);
+                if (value) {
+                    this.winner = selector;
+                    return value;
+                }
+            }
+            return "";
+        },
+    });
+
+    const titles = matcher(titleSelectors, (el) => {
+        const text = (el.innerText || "").trim();
+        if (text.length > 5) {
+            return text;
+        }
+        const attr = (el.getAttribute("title") || "").trim();
+        return attr.length > 5 ? attr : "";
+    }, titleSelector);
+    const prices = matcher(priceSelectors, (el) => {
+        const text = el.innerText || "";
+        return text.includes("Rp") ? text : "";
+    }, priceSelector);
+
+    let containers = [];
+    let containerSelector = null;
+    for (const selector of containerSelectors) {
+        containers = Array.from(document.querySelectorAll(selector));
+        if (containers.length) {
+            containerSelector = selector;
+            break;
+        }
+    }
+
+    const extract = (container) => {
+        const link = container.querySelector("a");
+        const img = container.querySelector("img");
+
+        const title = titles.match(container);
+        const price = prices.match(container);
+
+        const storeTexts = [];
+        for (const selector of storeSelectors) {
+            try {
+                for (const el of query(container, selector)) {
+                    const text = (el.innerText || "").trim();
+                    if (text.length > 2) {
+                        storeTexts.push(text);
+                    }
+                }
+            } catch (e) {}
+        }
+
+        return {
+            url: container.getAttribute("href") || (link && link.getAttribute("href")) || "",
+            title: title,
+            price: price,
+            store_texts: storeTexts,
+            image: (img && img.getAttribute("src")) || "",
+        };
+    };
+
+    const products = containers.slice(start).map(extract);
+    return {
+        selector: containerSelector,
+        title_selector: titles.winner,
+        price_selector: prices.winner,
+        count: containers.length,
+        products: products,
+    };
+}
+"""
+
+
+# Map keywords to category pages that work better; the first key (in this
+# order) found in the keyword wins
+CATEGORY_MAPPING: dict[str, str] = {
+    "smartphone": "handphone-tablet/handphone",
+    "phone": "handphone-tablet/handphone",
+    "handphone": "handphone-tablet/handphone",
+    "iphone": "handphone-tablet/handphone",
+    "android": "handphone-tablet/handphone",
+    "samsung": "handphone-tablet/handphone",
+    "xiaomi": "handphone-tablet/handphone",
+    "oppo": "handphone-tablet/handphone",
+    "vivo": "handphone-tablet/handphone",
+    "huawei": "handphone-tablet/handphone",
+    "tablet": "handphone-tablet/tablet",
+    "ipad": "handphone-tablet/tablet",
+    "laptop": "komputer-laptop/laptop",
+    "komputer": "komputer-laptop",
+    "macbook": "komputer-laptop/laptop",
+    "headphone": "elektronik/audio",
+    "earphone": "elektronik/audio",
+    "speaker": "elektronik/audio",
+    "audio": "elektronik/audio",
+    "lego": "mainan-hobi",
+    "toy": "mainan-hobi",
+    "mainan": "mainan-hobi",
+    "game": "mainan-hobi/games",
+    "konsol": "elektronik/gaming",
+    "playstation": "elektronik/gaming",
+    "xbox": "elektronik/gaming",
+    "nintendo": "elektronik/gaming",
+    "fashion": "fashion",
+    "baju": "fashion-pria",
+    "kaos": "fashion-pria",
+    "jaket": "fashion-pria",
+    "sepatu": "sepatu-pria",
+    "tas": "tas-travel",
+    "jam": "jam-tangan",
+    "watch": "jam-tangan",
+    "kamera": "kamera-foto-video",
+    "camera": "kamera-foto-video",
+    "tv": "elektronik/televisi-video",
+    "television": "elektronik/televisi-video",
+}
+
+# Indonesian e-commerce terms and their English translations
+# Unmapped words pass through unchanged, so identity entries are omitted
+TRANSLATION_MAP: dict[str, str] = {
+    # Product terms
+    "Handphone": "Smartphone",
+    "Bekas": "Used",
+    "Baru": "New",
+    "Second": "Second Hand",
+    "Mulus": "Excellent Condition",
+    "Ori": "Original",
+    "Garansi": "Warranty",
+    "Resmi": "Official",
+    "Fullset": "Complete Set",
+    "BNIB": "Brand New In Box",
+    "Segel": "Sealed",
+    "SEIN": "Official Distributor",
+    # Store and shipping terms
+    "Gratis": "Free",
+    "Ongkir": "Shipping",
+    "Gratis Ongkir": "Free Shipping",
+    "Beli Sekarang": "Buy Now",
+    "Masuk Keranjang": "Add to Cart",
+    "Tambah ke Wishlist": "Add to Wishlist",
+    # Product info terms
+    "Stok": "Stock",
+    "Terjual": "Sold",
+    "Ulasan": "Reviews",
+    "Diskusi": "Discussion",
+    "Deskripsi": "Description",
+    "Spesifikasi": "Specifications",
+    # Location terms
+    "Kab.": "Regency",
+    "Kota": "City",
+}
+
+
+# The helpers below are pure and see heavy key overlap across product cards
+# (the same store, price or title appears many times), so they are memoized.
+
+
+@lru_cache(maxsize=8192)
+def _translate(text: str) -> str:
+    """Translate words in text with TRANSLATION_MAP."""
+    # Only whole words can match; spaces and punctuation pass through as-is
+    return WORD_PATTERN.sub(lambda match: TRANSLATION_MAP.get(match[0], match[0]), text)
+
+
+@lru_cache(maxsize=8192)
+def _product_id(url: str) -> str:
+    """Extract the product ID from a non-empty product URL."""
+    for pattern in PRODUCT_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+
+    return url.split("/")[-1].split("?")[0]
+
+
+@lru_cache(maxsize=8192)
+def _clean_price(price_text: str) -> str:
+    """Clean and format non-empty price text."""
+    # Remove everything except digits, dots, and commas
+    cleaned = PRICE_STRIP_PATTERN.sub("", price_text)
+    if cleaned:
+        return f"Rp{cleaned}"
+    return price_text
+
+
+@lru_cache(maxsize=8192)
+def _store_id(url: str) -> str:
+    """Extract the store slug from a non-empty product URL."""
+    # Extract store name from URL pattern: tokopedia.com/storename/product
+    match = STORE_URL_PATTERN.search(url)
+    if match:
+        store_slug = match.group(1)
+        # Skip common non-store pages
+        if store_slug not in NON_STORE_SLUGS:
+            return store_slug
+
+    return ""
 
 
 class TokopediaTranslator:
     """Handles Indonesian to English translation for e-commerce terms."""
 
     def __init__(self) -> None:
-        self.translation_map: dict[str, str] = {
-            # Product terms
-            "Handphone": "Smartphone",
-            "Smartphone": "Smartphone",
-            "Tablet": "Tablet",
-            "Bekas": "Used",
-            "Baru": "New",
-            "Second": "Second Hand",
-            "Mulus": "Excellent Condition",
-            "Original": "Original",
-            "Ori": "Original",
-            "Garansi": "Warranty",
-            "Resmi": "Official",
-            "Fullset": "Complete Set",
-            "BNIB": "Brand New In Box",
-            "Segel": "Sealed",
-            "SEIN": "Official Distributor",
-            # Store and shipping terms
-            "Gratis": "Free",
-            "Ongkir": "Shipping",
-            "Gratis Ongkir": "Free Shipping",
-            "Beli Sekarang": "Buy Now",
-            "Masuk Keranjang": "Add to Cart",
-            "Tambah ke Wishlist": "Add to Wishlist",
-            # Product info terms
-            "Stok": "Stock",
-            "Terjual": "Sold",
-            "Rating": "Rating",
-            "Ulasan": "Reviews",
-            "Diskusi": "Discussion",
-            "Deskripsi": "Description",
-            "Spesifikasi": "Specifications",
-            # Location terms
-            "Jakarta": "Jakarta",
-            "Surabaya": "Surabaya",
-            "Bandung": "Bandung",
-            "Medan": "Medan",
-            "Kab.": "Regency",
-            "Kota": "City",
-        }
+        # Shared with the module-level translation cache; treat as read-only
+        self.translation_map: dict[str, str] = TRANSLATION_MAP
 
     def translate(self, text: str) -> str:
         """Translate Indonesian text to English."""
         if not text:
             return text
 
-        # Split text into words while preserving spaces and punctuation
-        words: list[str] = re.findall(r"\b\w+\b|\s+|[^\w\s]", text)
-        translated_parts: list[str] = []
-
-        for part in words:
-            if part.strip() in self.translation_map:
-                translated_parts.append(self.translation_map[part.strip()])
-            else:
-                translated_parts.append(part)
-
-        return "".join(translated_parts)
+        return _translate(text)
 
 
 class TokopediaScraper:
@@ -96,111 +422,40 @@ class TokopediaScraper:
         self.config = config
         self.translator = TokopediaTranslator()
         self.scraped_products: list[dict[str, Any]] = []
+        # Open JSON Lines file products are appended to as they're scraped
+        self._stream: BinaryIO | None = None
+        # Product URLs already collected, so re-rendered cards aren't duplicated
+        self._seen_urls: set[str] = set()
 
     def extract_product_id_from_url(self, url: str) -> str:
         """Extract product ID from Tokopedia URL."""
         if not url:
             return ""
 
-        # Common Tokopedia URL patterns
-        patterns = [
-            r"extParam[^&]*search_id%3D([A-Z0-9]+)",  # From extParam
-            r"-(\d{13,})",  # Long numeric ID (13+ digits)
-            r"/([^/?]+)\?",  # Product slug before query params
-            r"/([^/?]+)$",  # Product slug at end
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-
-        return url.split("/")[-1].split("?")[0] if url else ""
+        return _product_id(url)
 
     def clean_price(self, price_text: str) -> str:
         """Clean and format price text."""
         if not price_text:
             return ""
 
-        # Remove everything except digits, dots, and commas
-        cleaned = re.sub(r"[^\d.,]", "", price_text)
-        if cleaned:
-            return f"Rp{cleaned}"
-        return price_text
+        return _clean_price(price_text)
 
     def extract_store_id_from_url(self, url: str) -> str:
         """Extract store ID/slug from Tokopedia URL."""
         if not url:
             return ""
 
-        # Extract store name from URL pattern: tokopedia.com/storename/product
-        match = re.search(r"tokopedia\.com/([^/?]+)", url)
-        if match:
-            store_slug = match.group(1)
-            # Skip common non-store pages
-            if store_slug not in [
-                "p",
-                "discovery",
-                "help",
-                "about",
-                "careers",
-                "search",
-            ]:
-                return store_slug
-
-        return ""
-
-    def build_search_url(self) -> str:
-        """Build search URL based on keyword and brand configuration."""
-        keyword: str = self.config["keyword"].lower()
-        brand: str = self.config.get("brand", "").lower()
+        return _store_id(url)
 
-        # Map keywords to category pages that work better
-        category_mapping: dict[str, str] = {
-            "smartphone": "handphone-tablet/handphone",
-            "phone": "handphone-tablet/handphone",
-            "handphone": "handphone-tablet/handphone",
-            "iphone": "handphone-tablet/handphone",
-            "android": "handphone-tablet/handphone",
-            "samsung": "handphone-tablet/handphone",
-            "xiaomi": "handphone-tablet/handphone",
-            "oppo": "handphone-tablet/handphone",
-            "vivo": "handphone-tablet/handphone",
-            "huawei": "handphone-tablet/handphone",
-            "tablet": "handphone-tablet/tablet",
-            "ipad": "handphone-tablet/tablet",
-            "laptop": "komputer-laptop/laptop",
-            "komputer": "komputer-laptop",
-            "macbook": "komputer-laptop/laptop",
-            "headphone": "elektronik/audio",
-            "earphone": "elektronik/audio",
-            "speaker": "elektronik/audio",
-            "audio": "elektronik/audio",
-            "lego": "mainan-hobi",
-            "toy": "mainan-hobi",
-            "mainan": "mainan-hobi",
-            "game": "mainan-hobi/games",
-            "konsol": "elektronik/gaming",
-            "playstation": "elektronik/gaming",
-            "xbox": "elektronik/gaming",
-            "nintendo": "elektronik/gaming",
-            "fashion": "fashion",
-            "baju": "fashion-pria",
-            "kaos": "fashion-pria",
-            "jaket": "fashion-pria",
-            "sepatu": "sepatu-pria",
-            "tas": "tas-travel",
-            "jam": "jam-tangan",
-            "watch": "jam-tangan",
-            "kamera": "kamera-foto-video",
-            "camera": "kamera-foto-video",
-            "tv": "elektronik/televisi-video",
-            "television": "elektronik/televisi-video",
-        }
+    def build_search_url(self, keyword: str) -> str:
+        """Build search URL based on a keyword and the brand configuration."""
+        keyword = keyword.lower()
+        brand: str = self.config.get("brand", "").lower()
 
         # Try to find a category match
         category: str | None = None
-        for key, cat in category_mapping.items():
+        for key, cat in CATEGORY_MAPPING.items():
             if key in keyword:
                 category = cat
                 break
@@ -214,6 +469,12 @@ class TokopediaScraper:
             encoded_query: str = quote(search_query)
             return f"https://www.tokopedia.com/search?st=product&q={encoded_query}"
 
+    async def block_unneeded_requests(
+        self, context: PlaywrightPreNavCrawlingContext
+    ) -> None:
+        """Stop the browser from fetching assets the scraper never reads."""
+        await context.block_requests(extra_url_patterns=BLOCKED_URL_PATTERNS)
+
     async def handle_page_with_scroll(self, context: PlaywrightCrawlingContext) -> None:
         """Handle page with infinite scrolling or limited scrolling."""
         page: Page = context.page
@@ -221,8 +482,21 @@ class TokopediaScraper:
 
         print(f"🔍 Processing: {request.url}")
 
-        # Wait for page to load completely
-        await page.wait_for_load_state("networkidle")
+        # First container selector that matched on this page; later scrolls use
+        # only this one. Kept per page since pages are crawled concurrently.
+        container_selector: str | None = None
+        # Title and price selectors that last matched; tried first next scroll
+        title_selector: str | None = None
+        price_selector: str | None = None
+
+        # Wait for the first product card rather than network idle; analytics
+        # pings keep the network busy long after the products have rendered
+        try:
+            await page.locator(PRODUCT_CARD_SELECTOR).first.wait_for(
+                state="attached", timeout=PRODUCT_WAIT_TIMEOUT
+            )
+        except PlaywrightTimeoutError:
+            pass
         await asyncio.sleep(self.config.get("delay", 2))
 
         max_pages: int | None = self.config.get("max_pages")
@@ -240,42 +514,49 @@ class TokopediaScraper:
             print(f"   ♾️ Mode: Infinite scroll (up to {max_scroll_attempts} attempts)")
 
         while scroll_attempts < max_scroll_attempts:
-            # Look for product containers
-            product_containers: list[Locator] = await page.locator(
-                'div[data-testid="divProductWrapper"]'
-            ).all()
-
-            if len(product_containers) == 0:
-                # Try alternative selectors for different page types
-                product_containers = await page.locator(
-                    'a[data-testid="lnkProductContainer"]'
-                ).all()
-
-            # If still no containers, try search page selectors
-            if len(product_containers) == 0:
-                product_containers = await page.locator(
-                    '[data-testid*="product"], [data-testid*="Product"]'
-                ).all()
-
-            # If still none, try CSS class based selectors
-            if len(product_containers) == 0:
-                product_containers = await page.locator(
-                    '.prd_container-card, .css-bk6tzz, .css-5wh65g, [class*="product"]'
-                ).all()
-
-            print(f"   🔍 Found {len(product_containers)} product containers")
-
-            # Extract data from new products (skip already processed ones)
+            # Read every new product card in a single evaluate call
+            batch: dict[str, Any] = await page.evaluate(
+                EXTRACT_PRODUCTS_JS,
+                {
+                    "containerSelectors": [container_selector]
+                    if container_selector
+                    else CONTAINER_SELECTORS,
+                    "titleSelectors": TITLE_SELECTORS,
+                    "priceSelectors": PRICE_SELECTORS,
+                    "storeSelectors": STORE_INFO_SELECTORS,
+                    "titleSelector": title_selector,
+                    "priceSelector": price_selector,
+                    "start": scraped_count,
+                },
+            )
+            container_count: int = batch["count"]
+            if batch["selector"]:
+                container_selector = batch["selector"]
+            title_selector = batch["title_selector"]
+            price_selector = batch["price_selector"]
+
+            print(f"   🔍 Found {container_count} product containers")
+
+            # Cards in one batch were read at the same moment; stamp them once
+            scraped_at: str = datetime.now().isoformat()
+
+            # Build products from the new cards; the script skipped cards before
+            # `start`, so each scroll only transfers and processes new ones
             new_products: int = 0
-            for i, container in enumerate(
-                product_containers[scraped_count:], start=scraped_count
-            ):
+            for i, raw_product in enumerate(batch["products"], start=scraped_count):
                 try:
-                    product_data: dict[
-                        str, Any
-                    ] = await self.extract_product_from_container(container, page.url)
+                    product_data: dict[str, Any] = self.build_product(
+                        raw_product, page.url, scraped_at
+                    )
                     if product_data and product_data.get("Title"):
+                        product_url: str = product_data["Product URL"]
+                        if product_url:
+                            if product_url in self._seen_urls:
+                                continue
+                            self._seen_urls.add(product_url)
                         self.scraped_products.append(product_data)
+                        if self._stream:
+                            self._stream.write(orjson.dumps(product_data) + b"\n")
                         new_products += 1
                         print(
                             f"   ✓ {len(self.scraped_products)}: {product_data.get('Title', 'Unknown')[:50]}..."
@@ -285,7 +566,7 @@ class TokopediaScraper:
                     print(f"   ✗ Error extracting product {i + 1}: {e}")
                     continue
 
-            scraped_count = len(product_containers)
+            scraped_count = container_count
 
             # If we have max_pages set and reached our target, stop
             if max_pages and scroll_attempts >= max_pages * 5:
@@ -298,25 +579,28 @@ class TokopediaScraper:
             )
 
             # Get current product count before scrolling
-            products_before_scroll: int = len(product_containers)
+            products_before_scroll: int = container_count
 
             # Scroll to bottom
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await asyncio.sleep(self.config.get("delay", 2))
 
-            # Check if new products loaded
-            await page.wait_for_load_state("networkidle", timeout=10000)
-            new_containers: list[Locator] = await page.locator(
-                'div[data-testid="divProductWrapper"]'
-            ).all()
+            # Wait for a card past the ones we already had; on timeout the
+            # count check below treats it as the end of the page
+            card_selector: str = container_selector or PRODUCT_CARD_SELECTOR
+            cards: Locator = page.locator(card_selector)
+            try:
+                await cards.nth(products_before_scroll).wait_for(
+                    state="attached", timeout=PRODUCT_WAIT_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                pass
 
-            if len(new_containers) == 0:
-                new_containers = await page.locator(
-                    'a[data-testid="lnkProductContainer"]'
-                ).all()
+            # Check if new products loaded
+            new_container_count: int = await cards.count()
 
             # If no new products loaded, we've reached the end
-            if len(new_containers) <= products_before_scroll:
+            if new_container_count <= products_before_scroll:
                 print(f"   📋 No more products to load. Reached end of page.")
                 break
 
@@ -325,215 +609,109 @@ class TokopediaScraper:
         print(f"   📊 Total products scraped: {len(self.scraped_products)}")
         print(f"   📜 Scroll attempts completed: {scroll_attempts}")
 
-    async def extract_product_from_container(
-        self, container: Locator, base_url: str
+    def build_product(
+        self, raw_product: dict[str, Any], base_url: str, scraped_at: str
     ) -> dict[str, Any]:
-        """Extract comprehensive product data from a container element."""
-        try:
-            # Extract product URL
-            product_url: str = ""
-            try:
-                # Check if container itself is a link
-                href: str | None = await container.get_attribute("href")
-                if href:
-                    product_url = href
-                else:
-                    # Look for link within container
-                    link: Locator = container.locator("a").first
-                    if await link.count() > 0:
-                        href = await link.get_attribute("href")
-                        if href:
-                            product_url = href
-            except Exception:
-                pass
-
-            # Make URL absolute
-            if product_url and not product_url.startswith("http"):
-                if product_url.startswith("/"):
-                    product_url = f"https://www.tokopedia.com{product_url}"
-                else:
-                    product_url = urljoin(base_url, product_url)
-
-            # Extract title using multiple possible selectors
-            title: str = ""
-            title_selectors: list[str] = [
-                ".css-20kt3o",  # Primary title class (category pages)
-                'span[data-testid*="spnSRPProdName"]',  # Search result product name
-                'span[data-testid*="title"]',
-                'span[data-testid*="name"]',
-                'div[data-testid*="title"]',
-                'span[class*="title"]',
-                'span[class*="name"]',
-                'span[class*="prd_link-prod-name"]',  # Search page product name
-                ".css-3017qm",  # Alternative title class
-                'span[data-unify="Typography"]',  # Typography component
-                "h3",
-                "h4",
-                "h5",  # Generic headings
-                "a[title]",  # Links with title attribute
-                '[class*="name"]',
-                '[class*="title"]',  # Generic class patterns
-            ]
-
-            for selector in title_selectors:
-                try:
-                    title_elem: Locator = container.locator(selector).first
-                    if await title_elem.count() > 0:
-                        title_text: str = await title_elem.inner_text()
-                        if (
-                            title_text
-                            and title_text.strip()
-                            and len(title_text.strip()) > 5
-                        ):
-                            title = title_text.strip()
-                            break
-                        # Also try title attribute if inner text is empty
-                        title_attr: str | None = await title_elem.get_attribute("title")
-                        if (
-                            title_attr
-                            and title_attr.strip()
-                            and len(title_attr.strip()) > 5
-                        ):
-                            title = title_attr.strip()
-                            break
-                except:
-                    continue
-
-            # Extract price
-            price: str = ""
-            price_selectors: list[str] = [
-                ".css-o5uqvq",  # Primary price class (category pages)
-                'span[data-testid*="spnSRPProdPrice"]',  # Search result price
-                'span[class*="price"]',
-                'div[class*="price"]',
-                'span:has-text("Rp")',
-                'div:has-text("Rp")',
-                ".css-h66vau",  # Alternative price class
-                ".prd_link-prod-price",  # Search page price class
-                '[class*="price"]',  # Generic price pattern
-                'span[data-unify="Typography"]:has-text("Rp")',  # Typography with Rp
-            ]
-
-            for selector in price_selectors:
-                try:
-                    price_elem: Locator = container.locator(selector).first
-                    if await price_elem.count() > 0:
-                        price_text: str = await price_elem.inner_text()
-                        if price_text and "Rp" in price_text:
-                            price = self.clean_price(price_text)
-                            break
-                except:
-                    continue
-
-            # Extract store information
-            store_name: str = ""
-            store_location: str = ""
-            store_info_selectors: list[str] = [
-                ".css-ywdpwd",  # Store info class
-                'span[data-testid*="spnSRPProdTablet"]',
-                'span[class*="shop"]',
-                'div[class*="shop"]',
-                'span[class*="store"]',
-                'div[class*="store"]',
-            ]
-
-            store_texts: list[str] = []
-            for selector in store_info_selectors:
-                try:
-                    elements: list[Locator] = await container.locator(selector).all()
-                    for elem in elements:
-                        text: str = await elem.inner_text()
-                        if text and text.strip() and len(text.strip()) > 2:
-                            store_texts.append(text.strip())
-                except:
-                    continue
-
-            # Parse store information
-            if store_texts:
-                if len(store_texts) >= 2:
-                    store_location = store_texts[0]
-                    store_name = store_texts[1]
+        """Build product data from the raw fields read by EXTRACT_PRODUCTS_JS."""
+        # Make URL absolute
+        product_url: str = raw_product["url"]
+        if product_url and not product_url.startswith("http"):
+            if product_url.startswith("/"):
+                product_url = f"https://www.tokopedia.com{product_url}"
+            else:
+                product_url = urljoin(base_url, product_url)
+
+        title: str = raw_product["title"]
+        price: str = self.clean_price(raw_product["price"])
+
+        # Parse store information
+        store_name: str = ""
+        store_location: str = ""
+        store_texts: list[str] = raw_product["store_texts"]
+        if store_texts:
+            if len(store_texts) >= 2:
+                store_location = store_texts[0]
+                store_name = store_texts[1]
+            else:
+                text: str = store_texts[0]
+                if LOCATION_PATTERN.search(text):
+                    store_location = text
                 else:
-                    text: str = store_texts[0]
-                    if any(
-                        loc in text
-                        for loc in ["Jakarta", "Surabaya", "Bandung", "Kab.", "Kota"]
-                    ):
-                        store_location = text
-                    else:
-                        store_name = text
-
-            # Extract image URL
-            image_url: str = ""
-            try:
-                img_elem: Locator = container.locator("img").first
-                if await img_elem.count() > 0:
-                    image_url_raw: str | None = await img_elem.get_attribute("src")
-                    if image_url_raw and not image_url_raw.startswith("http"):
-                        if image_url_raw.startswith("//"):
-                            image_url = f"https:{image_url_raw}"
-                        else:
-                            image_url = f"https://www.tokopedia.com{image_url_raw}"
-                    elif image_url_raw:
-                        image_url = image_url_raw
-            except:
-                pass
-
-            # Skip if missing essential data
-            if not title:
-                return {}
+                    store_name = text
+
+        # Make image URL absolute
+        image_url: str = ""
+        image_url_raw: str = raw_product["image"]
+        if image_url_raw and not image_url_raw.startswith("http"):
+            if image_url_raw.startswith("//"):
+                image_url = f"https:{image_url_raw}"
+            else:
+                image_url = f"https://www.tokopedia.com{image_url_raw}"
+        elif image_url_raw:
+            image_url = image_url_raw
 
-            # Extract store ID and build store URL
-            store_id: str = self.extract_store_id_from_url(product_url)
-            store_url: str | None = (
-                f"https://www.tokopedia.com/{store_id}" if store_id else None
-            )
+        # Skip if missing essential data
+        if not title:
+            return {}
 
-            # Build product data in the requested format
-            product_data: dict[str, Any] = {
-                "Product ID": self.extract_product_id_from_url(product_url),
-                "Title": self.translator.translate(title),
-                "Sale Price": price,
-                "Original Price": price,  # Tokopedia doesn't always show original price
-                "Discount (%)": 0,  # Would need specific implementation
-                "Currency": "IDR",
-                "Rating": None,  # Placeholder - would need specific implementation
-                "Orders Count": None,  # Placeholder - would need specific implementation
-                "Store Name": self.translator.translate(store_name)
-                if store_name
-                else None,
-                "Store ID": store_id if store_id else None,
-                "Store URL": store_url,
-                "Product URL": product_url,
-                "Image URL": image_url,
-                "Brand": self.config.get("brand", ""),
-                "Location": self.translator.translate(store_location)
-                if store_location
-                else None,
-                "Scraped At": datetime.now().isoformat(),
-            }
+        # Extract store ID and build store URL
+        store_id: str = self.extract_store_id_from_url(product_url)
+        store_url: str | None = (
+            f"https://www.tokopedia.com/{store_id}" if store_id else None
+        )
 
-            return product_data
+        # Build product data in the requested format
+        product_data: dict[str, Any] = {
+            "Product ID": self.extract_product_id_from_url(product_url),
+            "Title": self.translator.translate(title),
+            "Sale Price": price,
+            "Original Price": price,  # Tokopedia doesn't always show original price
+            # Discount, rating and orders count are not read from search cards
+            # yet, so they are left out rather than emitted as placeholders
+            "Currency": "IDR",
+            "Store Name": self.translator.translate(store_name)
+            if store_name
+            else None,
+            "Store ID": store_id if store_id else None,
+            "Store URL": store_url,
+            "Product URL": product_url,
+            "Image URL": image_url,
+            "Brand": self.config.get("brand", ""),
+            "Location": self.translator.translate(store_location)
+            if store_location
+            else None,
+            "Scraped At": scraped_at,
+        }
 
-        except Exception as e:
-            print(f"Error in extract_product_from_container: {e}")
-            return {}
+        return product_data
 
     async def run_scraper(self) -> list[dict[str, Any]]:
         """Run the scraper and return collected products."""
+        keywords: list[str] = self.config["keywords"]
+        brand: str = self.config.get("brand", "")
+        # Keywords can share a category page; crawl each URL once
+        urls: list[str] = list(
+            dict.fromkeys(self.build_search_url(keyword) for keyword in keywords)
+        )
+
+        # Pages are crawled concurrently in tabs of one browser
+        concurrency: int = min(len(urls), MAX_CONCURRENT_PAGES)
         crawler = PlaywrightCrawler(
             request_handler=self.handle_page_with_scroll,
             headless=True,
             browser_type="chromium",
-            max_requests_per_crawl=1,  # Only process one page with scrolling
+            max_requests_per_crawl=len(urls),  # One scrolled page per URL
+            concurrency_settings=ConcurrencySettings(
+                desired_concurrency=concurrency, max_concurrency=concurrency
+            ),
+            browser_launch_options={"args": BROWSER_ARGS},
+            browser_new_context_options={"viewport": BROWSER_VIEWPORT},
         )
-
-        url: str = self.build_search_url()
+        crawler.pre_navigation_hook(self.block_unneeded_requests)
 
         print(f"🚀 Starting Tokopedia Scraper")
-        print(
-            f"🔍 Search Query: {self.config.get('brand', '')} {self.config['keyword']}".strip()
-        )
+        for keyword in keywords:
+            print(f"🔍 Search Query: {brand} {keyword}".strip())
 
         max_pages: int | None = self.config.get("max_pages")
         if max_pages:
@@ -541,26 +719,39 @@ class TokopediaScraper:
         else:
             print(f"♾️ Mode: Infinite scroll (scrape ALL products)")
 
-        print(f"🌐 URL: {url}")
+        for url in urls:
+            print(f"🌐 URL: {url}")
         print("=" * 60)
 
+        # Stream products to disk as they're scraped, if asked to
+        stream_path: str | None = self.config.get("stream_path")
+        if stream_path:
+            self._stream = open(stream_path, "ab")
+
         try:
-            await crawler.run([url])
-        except Exception as e:
-            # If category URL fails, try search fallback
-            if "status code: 410" in str(e) or "status code: 404" in str(e):
-                print(f"⚠️ Category URL failed, trying search fallback...")
-                search_query: str = (
-                    f"{self.config.get('brand', '')} {self.config['keyword']}".strip()
-                )
-                encoded_query: str = quote(search_query)
-                fallback_url: str = (
-                    f"https://www.tokopedia.com/search?st=product&q={encoded_query}"
-                )
-                print(f"🌐 Fallback URL: {fallback_url}")
-                await crawler.run([fallback_url])
-            else:
-                raise e
+            try:
+                await crawler.run(urls)
+            except Exception as e:
+                # If category URLs fail, try search fallback
+                if "status code: 410" in str(e) or "status code: 404" in str(e):
+                    print(f"⚠️ Category URL failed, trying search fallback...")
+                    fallback_urls: list[str] = [
+                        "https://www.tokopedia.com/search?st=product&q="
+                        + quote(f"{brand} {keyword}".strip())
+                        for keyword in keywords
+                    ]
+                    for fallback_url in fallback_urls:
+                        print(f"🌐 Fallback URL: {fallback_url}")
+                    await crawler.run(fallback_urls)
+                else:
+                    raise e
+        finally:
+            if self._stream:
+                empty: bool = self._stream.tell() == 0
+                self._stream.close()
+                self._stream = None
+                if empty:
+                    os.remove(stream_path)
 
         print("=" * 60)
         print(f"✅ Scraping completed!")
@@ -579,11 +770,18 @@ Examples:
   %(prog)s --keyword "smartphone" --brand "iPhone"
   %(prog)s -k "laptop" -b "MacBook" --max-pages 3
   %(prog)s -k "headphone" -b "Sony"
+  %(prog)s -k "laptop" -k "tablet" -b "Apple" --browser
         """,
     )
 
     # Required arguments
-    parser.add_argument("--keyword", "-k", required=True, help="Search keyword")
+    parser.add_argument(
+        "--keyword",
+        "-k",
+        required=True,
+        action="append",
+        help="Search keyword (repeat to scrape several keywords concurrently)",
+    )
     parser.add_argument(
         "--brand",
         "-b",
@@ -609,6 +807,11 @@ Examples:
         default=None,
         help="Job ID for tracking this scraping session (auto-generated if not provided)",
     )
+    parser.add_argument(
+        "--browser",
+        action="store_true",
+        help="Scrape rendered pages with Playwright instead of the GraphQL API",
+    )
 
     return parser
 
@@ -618,42 +821,84 @@ async def main() -> None:
     parser: argparse.ArgumentParser = create_parser()
     args: argparse.Namespace = parser.parse_args()
 
+    # Output files share a name; scrapers stream to the .jsonl ones
+    now: datetime = datetime.now()
+    date: str = now.strftime("%Y%m%d")
+    unix_timestamp: int = int(time.time())
+    brand: str = args.brand.lower().replace(" ", "-")
+    output_base: str = f"results/tokopedia_{brand}_{date}_{unix_timestamp}"
+
+    # Ensure results directory exists
+    os.makedirs("results", exist_ok=True)
+
     # Convert args to config dictionary
     config: dict[str, Any] = {
-        "keyword": args.keyword,
+        "keywords": args.keyword,
         "brand": args.brand,
         "max_pages": args.max_pages,
         "delay": args.delay,
+        "stream_path": f"{output_base}.jsonl",
     }
 
+    # Each concurrent API scraper streams to its own file, so their writes
+    # never interleave; all stream files are removed once the JSON is saved
+    keyword_stream_paths: list[str] = [
+        f"{output_base}_{index}.jsonl" for index in range(len(args.keyword))
+    ]
+    stream_paths: list[str] = [config["stream_path"], *keyword_stream_paths]
+
     try:
-        # Initialize and run scraper
-        scraper: TokopediaScraper = TokopediaScraper(config)
-        products: list[dict[str, Any]] = await scraper.run_scraper()
+        # Prefer the GraphQL API, which returns the same data as the rendered
+        # pages without a browser; keep Playwright as a fallback
+        products: list[dict[str, Any]] = []
+        if not args.browser:
+            # One API scraper per keyword, run concurrently
+            keyword_results: list[list[dict[str, Any]]] = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        TokopediaGraphQLScraper(
+                            {**config, "keyword": keyword, "stream_path": stream_path}
+                        ).scrape_products
+                    )
+                    for keyword, stream_path in zip(args.keyword, keyword_stream_paths)
+                )
+            )
+            products = [product for result in keyword_results for product in result]
+            if not products:
+                print("⚠️ GraphQL API returned no products, falling back to the browser...")
+
+        if not products:
+            scraper: TokopediaScraper = TokopediaScraper(config)
+            products = await scraper.run_scraper()
 
-        # Output JSON results
+        # Output JSON results; serialize once for both stdout and the file
         if products:
-            output_json: str = json.dumps(products, indent=2, ensure_ascii=False)
+            output_json: bytes = orjson.dumps(products, option=orjson.OPT_INDENT_2)
             print("\n" + "=" * 60)
             print("📋 SCRAPED PRODUCTS (JSON OUTPUT):")
             print("=" * 60)
-            print(output_json)
+            print(output_json.decode())
 
             # Also save to file
-            now: datetime = datetime.now()
-            date: str = now.strftime("%Y%m%d")
-            unix_timestamp: int = int(time.time())
-            brand: str = args.brand.lower().replace(" ", "-")
-            filename: str = f"tokopedia_{brand}_{date}_{unix_timestamp}.json"
-            filepath: str = f"results/{filename}"
-
-            # Ensure results directory exists
-            os.makedirs("results", exist_ok=True)
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(products, f, indent=2, ensure_ascii=False)
+            filepath: str = f"{output_base}.json"
+            with open(filepath, "wb") as f:
+                f.write(output_json)
             print(f"\n💾 Results saved to: {filepath}")
+
+            # The streamed copies are superseded by the saved results
+            for stream_path in stream_paths:
+                try:
+                    os.remove(stream_path)
+                except FileNotFoundError:
+                    pass
         else:
+            # Don't leave the per-keyword stream files behind when they're empty
+            for stream_path in stream_paths:
+                try:
+                    if os.path.getsize(stream_path) == 0:
+                        os.remove(stream_path)
+                except FileNotFoundError:
+                    pass
             print("\n⚠️ No products found.")
             sys.exit(1)
 
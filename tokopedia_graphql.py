@@ -11,19 +11,23 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import random
 import re
 import sys
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, BinaryIO, Dict, List, Optional, cast
 from urllib.parse import quote
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from common.job_index import JobIndex
 from common.job_metadata import JobMetadata, JobStatus
 from common.path_utils import PathUtils
 
@@ -31,67 +35,105 @@ from common.path_utils import PathUtils
 from csv_writer import TokopediaCSVWriter
 
 
+# Write buffer for the JSON Lines stream; products are small, so lines are
+# handed to the kernel in large blocks rather than one write per product
+STREAM_BUFFER_SIZE = 1 << 20
+
+# Connections kept alive to the GraphQL host
+GRAPHQL_POOL_SIZE = 4
+
+# Stands in for the per-page params string in the serialized request body
+PARAMS_PLACEHOLDER = "__PARAMS__"
+_PARAMS_PLACEHOLDER_JSON = orjson.dumps(PARAMS_PLACEHOLDER)
+
+# Most product IDs sent back as minus_ids on later pages
+MAX_EXCLUDED_IDS = 500
+
+
+def _abs_url(url: str) -> str:
+    """Make a Tokopedia URL absolute; protocol-relative URLs get https."""
+    if not url or url[:4] == "http":
+        return url
+    if url[:2] == "//":
+        return f"https:{url}"
+    if url[:1] == "/":
+        return f"https://www.tokopedia.com{url}"
+    return url
+
+
+# Unmapped words pass through unchanged, so identity entries are omitted
+TRANSLATION_MAP: Dict[str, str] = {
+    # Product terms
+    "Handphone": "Smartphone",
+    "Bekas": "Used",
+    "Baru": "New",
+    "Second": "Second Hand",
+    "Mulus": "Excellent Condition",
+    "Ori": "Original",
+    "Garansi": "Warranty",
+    "Resmi": "Official",
+    "Fullset": "Complete Set",
+    "BNIB": "Brand New In Box",
+    "Segel": "Sealed",
+    "SEIN": "Official Distributor",
+    # Store and shipping terms
+    "Gratis": "Free",
+    "Ongkir": "Shipping",
+    "Gratis Ongkir": "Free Shipping",
+    "Beli Sekarang": "Buy Now",
+    "Masuk Keranjang": "Add to Cart",
+    "Tambah ke Wishlist": "Add to Wishlist",
+    # Product info terms
+    "Stok": "Stock",
+    "Terjual": "Sold",
+    "Ulasan": "Reviews",
+    "Diskusi": "Discussion",
+    "Deskripsi": "Description",
+    "Spesifikasi": "Specifications",
+    # Location terms
+    "Kab.": "Regency",
+    "Kota": "City",
+}
+
+# Only whole words are translated, so multi-word and punctuated keys can
+# never match and are left out of the pattern
+_TRANSLATED_WORDS: List[str] = sorted(
+    (key for key in TRANSLATION_MAP if re.fullmatch(r"\w+", key)),
+    key=len,
+    reverse=True,
+)
+TRANSLATED_WORD_PATTERN: re.Pattern[str] = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _TRANSLATED_WORDS)) + r")\b"
+)
+
+
+def _replace_word(match: re.Match[str]) -> str:
+    """Replacement for TRANSLATED_WORD_PATTERN.sub; matches are map keys."""
+    return TRANSLATION_MAP[match[0]]
+
+
+# Store names, cities and titles repeat heavily across pages, and the map is
+# fixed, so translations are memoized once for the module
+@lru_cache(maxsize=8192)
+def _translate(text: str) -> str:
+    """Translate words in text with TRANSLATION_MAP."""
+    # Translate matched words in one pass; spaces and punctuation pass through
+    return TRANSLATED_WORD_PATTERN.sub(_replace_word, text)
+
+
 class TokopediaTranslator:
     """Handles Indonesian to English translation for e-commerce terms."""
 
     def __init__(self) -> None:
-        self.translation_map: Dict[str, str] = {
-            # Product terms
-            "Handphone": "Smartphone",
-            "Smartphone": "Smartphone",
-            "Tablet": "Tablet",
-            "Bekas": "Used",
-            "Baru": "New",
-            "Second": "Second Hand",
-            "Mulus": "Excellent Condition",
-            "Original": "Original",
-            "Ori": "Original",
-            "Garansi": "Warranty",
-            "Resmi": "Official",
-            "Fullset": "Complete Set",
-            "BNIB": "Brand New In Box",
-            "Segel": "Sealed",
-            "SEIN": "Official Distributor",
-            # Store and shipping terms
-            "Gratis": "Free",
-            "Ongkir": "Shipping",
-            "Gratis Ongkir": "Free Shipping",
-            "Beli Sekarang": "Buy Now",
-            "Masuk Keranjang": "Add to Cart",
-            "Tambah ke Wishlist": "Add to Wishlist",
-            # Product info terms
-            "Stok": "Stock",
-            "Terjual": "Sold",
-            "Rating": "Rating",
-            "Ulasan": "Reviews",
-            "Diskusi": "Discussion",
-            "Deskripsi": "Description",
-            "Spesifikasi": "Specifications",
-            # Location terms
-            "Jakarta": "Jakarta",
-            "Surabaya": "Surabaya",
-            "Bandung": "Bandung",
-            "Medan": "Medan",
-            "Kab.": "Regency",
-            "Kota": "City",
-        }
+        # Shared with the module-level translation cache; treat as read-only
+        self.translation_map: Dict[str, str] = TRANSLATION_MAP
 
     def translate(self, text: str) -> str:
         """Translate Indonesian text to English."""
         if not text:
             return text
 
-        # Split text into words while preserving spaces and punctuation
-        words: List[str] = re.findall(r"\b\w+\b|\s+|[^\w\s]", text)
-        translated_parts: List[str] = []
-
-        for part in words:
-            if part.strip() in self.translation_map:
-                translated_parts.append(self.translation_map[part.strip()])
-            else:
-                translated_parts.append(part)
-
-        return "".join(translated_parts)
+        return _translate(text)
 
 
 class TokopediaGraphQLScraper:
@@ -100,244 +142,38 @@ class TokopediaGraphQLScraper:
     # GraphQL endpoint
     GRAPHQL_URL = "https://gql.tokopedia.com/graphql/SearchProductV5Query"
 
-    # GraphQL query for product search
+    # GraphQL query for product search; selects only the fields read by
+    # _extract_search_id and _format_product, which keeps responses small
     GRAPHQL_QUERY = """
     query SearchProductV5Query($params: String!) {
         searchProductV5(params: $params) {
             header {
                 totalData
-                responseCode
-                keywordProcess
-                keywordIntention
-                componentID
-                isQuerySafe
                 additionalParams
-                backendFilters
-                meta {
-                    dynamicFields
-                    __typename
-                }
-                __typename
             }
             data {
-                totalDataText
-                banner {
-                    position
-                    text
-                    applink
-                    url
-                    imageURL
-                    componentID
-                    trackingOption
-                    __typename
-                }
-                redirection {
-                    url
-                    __typename
-                }
-                related {
-                    relatedKeyword
-                    position
-                    trackingOption
-                    otherRelated {
-                        keyword
-                        url
-                        applink
-                        componentID
-                        products {
-                            oldID: id
-                            id: id_str_auto_
-                            name
-                            url
-                            applink
-                            mediaURL {
-                                image
-                                __typename
-                            }
-                            shop {
-                                oldID: id
-                                id: id_str_auto_
-                                name
-                                city
-                                tier
-                                __typename
-                            }
-                            badge {
-                                oldID: id
-                                id: id_str_auto_
-                                title
-                                url
-                                __typename
-                            }
-                            price {
-                                text
-                                number
-                                __typename
-                            }
-                            freeShipping {
-                                url
-                                __typename
-                            }
-                            labelGroups {
-                                position
-                                title
-                                type
-                                url
-                                styles {
-                                    key
-                                    value
-                                    __typename
-                                }
-                                __typename
-                            }
-                            rating
-                            wishlist
-                            ads {
-                                id
-                                productClickURL
-                                productViewURL
-                                productWishlistURL
-                                tag
-                                __typename
-                            }
-                            meta {
-                                oldWarehouseID: warehouseID
-                                warehouseID: warehouseID_str_auto_
-                                componentID
-                                __typename
-                            }
-                            __typename
-                        }
-                        __typename
-                    }
-                    __typename
-                }
-                suggestion {
-                    currentKeyword
-                    suggestion
-                    query
-                    text
-                    componentID
-                    trackingOption
-                    __typename
-                }
-                ticker {
-                    oldID: id
-                    id: id_str_auto_
-                    text
-                    query
-                    applink
-                    componentID
-                    trackingOption
-                    __typename
-                }
-                violation {
-                    headerText
-                    descriptionText
-                    imageURL
-                    ctaURL
-                    ctaApplink
-                    buttonText
-                    buttonType
-                    __typename
-                }
                 products {
                     oldID: id
-                    id: id_str_auto_
-                    ttsProductID
                     name
                     url
-                    applink
                     mediaURL {
                         image
                         image300
-                        videoCustom
-                        __typename
                     }
                     shop {
                         oldID: id
-                        id: id_str_auto_
-                        ttsSellerID
                         name
                         url
                         city
-                        tier
-                        __typename
-                    }
-                    stock {
-                        ttsSKUID
-                        __typename
-                    }
-                    badge {
-                        oldID: id
-                        id: id_str_auto_
-                        title
-                        url
-                        __typename
                     }
                     price {
                         text
-                        number
-                        range
                         original
                         discountPercentage
-                        __typename
-                    }
-                    freeShipping {
-                        url
-                        __typename
-                    }
-                    labelGroups {
-                        position
-                        title
-                        type
-                        url
-                        styles {
-                            key
-                            value
-                            __typename
-                        }
-                        __typename
-                    }
-                    labelGroupsVariant {
-                        title
-                        type
-                        typeVariant
-                        hexColor
-                        __typename
-                    }
-                    category {
-                        oldID: id
-                        id: id_str_auto_
-                        name
-                        breadcrumb
-                        gaKey
-                        __typename
                     }
                     rating
-                    wishlist
-                    ads {
-                        id
-                        productClickURL
-                        productViewURL
-                        productWishlistURL
-                        tag
-                        __typename
-                    }
-                    meta {
-                        oldParentID: parentID
-                        parentID: parentID_str_auto_
-                        oldWarehouseID: warehouseID
-                        warehouseID: warehouseID_str_auto_
-                        isImageBlurred
-                        isPortrait
-                        __typename
-                    }
-                    __typename
                 }
-                __typename
             }
-            __typename
         }
     }
     """
@@ -345,14 +181,34 @@ class TokopediaGraphQLScraper:
     def __init__(self, config: Dict[str, Any]) -> None:
         self.config = config
         self.translator = TokopediaTranslator()
+        # Stamped on every product; read once instead of per product
+        self._brand: str = config.get("brand", "")
         self.session = requests.Session()
         self.scraped_products: List[Dict[str, Any]] = []
-        self.excluded_product_ids: List[str] = []
+        # Insertion-ordered set of seen product IDs (dict keys), so repeats
+        # are dropped and the newest ones can be kept when capping minus_ids
+        self.excluded_product_ids: Dict[str, None] = {}
+        # minus_ids value, re-joined only when new IDs were added
+        self._excluded_joined = ""
+        self._excluded_joined_len = 0
         self.search_id: Optional[str] = None
+        # Open JSON Lines file products are appended to as they're scraped
+        self._stream: Optional[BinaryIO] = None
 
         # Setup session with realistic headers
         self._setup_session()
 
+        # Request body with a placeholder standing in for the params string
+        self._payload_template: bytes = orjson.dumps(
+            [
+                {
+                    "operationName": "SearchProductV5Query",
+                    "variables": {"params": PARAMS_PLACEHOLDER},
+                    "query": self.GRAPHQL_QUERY,
+                }
+            ]
+        )
+
     def _setup_session(self) -> None:
         """Setup HTTP session with realistic headers."""
         # Generate random device IDs
@@ -360,10 +216,18 @@ class TokopediaGraphQLScraper:
         user_id = str(random.randint(100000000, 999999999))
         unique_id = str(uuid.uuid4()).replace("-", "")
 
+        # Every request goes to one host, so a single small pool of kept-alive
+        # connections is reused across pages instead of reconnecting
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=GRAPHQL_POOL_SIZE),
+        )
+
+        # accept-encoding is left to requests, which only advertises the
+        # encodings it can decode (br needs the optional brotli package)
         self.session.headers.update(
             {
                 "accept": "*/*",
-                "accept-encoding": "gzip, deflate, br",
                 "accept-language": "en-US,en;q=0.9",
                 "bd-device-id": device_id,
                 "bd-web-id": device_id,
@@ -391,60 +255,94 @@ class TokopediaGraphQLScraper:
         self.device_id = device_id
         self.user_id = user_id
         self.unique_id = unique_id
+        self._encode_static_params()
+
+    def _encode_static_params(self) -> None:
+        """URL-encode the search parameters that are the same for every page."""
+
+        def encode(params: Dict[str, str]) -> str:
+            return "&".join(f"{k}={quote(v)}" for k, v in params.items())
+
+        # Split around page, q and start, which vary and keep their positions
+        self._params_head = encode(
+            {
+                "device": "desktop",
+                "enter_method": "normal_search",
+                "l_name": "sre",
+                "navsource": "home,home",
+                "ob": "23",  # Sort order
+            }
+        )
+        self._params_middle = encode(
+            {
+                "related": "true",
+                "rows": "60",  # Results per page
+                "safe_search": "false",
+                "sc": "",
+                "scheme": "https",
+                "shipping": "",
+                "show_adult": "false",
+                "source": "search",
+                "srp_component_id": "02.01.00.00",
+                "srp_page_id": "",
+                "srp_page_title": "",
+                "st": "product",
+            }
+        )
+        self._params_tail = encode(
+            {
+                "topads_bucket": "true",
+                "unique_id": self.unique_id,
+                "user_addressId": "",
+                "user_cityId": "176",
+                "user_districtId": "2274",
+                "user_id": self.user_id,
+                "user_lat": "",
+                "user_long": "",
+                "user_postCode": "",
+                "user_warehouseId": "0",
+                "variants": "",
+                "warehouses": "",
+            }
+        )
 
     def _build_search_params(self, query: str, page: int = 1, start: int = 0) -> str:
         """Build search parameters for GraphQL request."""
-        # Base parameters
-        params = {
-            "device": "desktop",
-            "enter_method": "normal_search",
-            "l_name": "sre",
-            "navsource": "home,home",
-            "ob": "23",  # Sort order
-            "page": str(page),
-            "q": query,
-            "related": "true",
-            "rows": "60",  # Results per page
-            "safe_search": "false",
-            "sc": "",
-            "scheme": "https",
-            "shipping": "",
-            "show_adult": "false",
-            "source": "search",
-            "srp_component_id": "02.01.00.00",
-            "srp_page_id": "",
-            "srp_page_title": "",
-            "st": "product",
-            "start": str(start),
-            "topads_bucket": "true",
-            "unique_id": self.unique_id,
-            "user_addressId": "",
-            "user_cityId": "176",
-            "user_districtId": "2274",
-            "user_id": self.user_id,
-            "user_lat": "",
-            "user_long": "",
-            "user_postCode": "",
-            "user_warehouseId": "0",
-            "variants": "",
-            "warehouses": "",
-        }
+        # Base parameters; only page, q and start change between requests, the
+        # rest were encoded once in _encode_static_params
+        params_string = (
+            f"{self._params_head}&page={page}&q={quote(query)}"
+            f"&{self._params_middle}&start={start}&{self._params_tail}"
+        )
 
         # Add pagination-specific parameters
         if page > 1:
-            params["has_more"] = "true"
-            params["next_offset_organic"] = str(start - 60)
-            params["next_offset_organic_ad"] = str(start - 60)
-
-            # Add excluded product IDs to avoid duplicates
-            if self.excluded_product_ids:
-                params["minus_ids"] = ",".join(self.excluded_product_ids)
+            params: Dict[str, str] = {
+                "has_more": "true",
+                "next_offset_organic": str(start - 60),
+                "next_offset_organic_ad": str(start - 60),
+            }
 
-            # Add search ID for consistency
+            # Add search ID for consistency; it keeps the server's result
+            # order stable, so excluded product IDs are only needed without it
             if self.search_id:
                 params["search_id"] = self.search_id
+            elif self.excluded_product_ids:
+                params["minus_ids"] = self._joined_excluded_ids()
+
+            params_string += "".join(f"&{k}={quote(v)}" for k, v in params.items())
+
+        return params_string
 
-        return "&".join(f"{k}={quote(str(v))}" for k, v in params.items())
+    def _joined_excluded_ids(self) -> str:
+        """Comma-join the most recent excluded product IDs for minus_ids."""
+        ids = self.excluded_product_ids
+        if len(ids) != self._excluded_joined_len:
+            # Capped so the request URL stays bounded on deep scrapes
+            recent = list(ids)[-MAX_EXCLUDED_IDS:]
+            self._excluded_joined = ",".join(recent)
+            self._excluded_joined_len = len(ids)
+        return self._excluded_joined
 
     def _make_graphql_request(
         self, query: str, page: int = 1, start: int = 0
@@ -452,21 +350,21 @@ class TokopediaGraphQLScraper:
         """Make GraphQL request to Tokopedia API."""
         params_string = self._build_search_params(query, page, start)
 
-        payload: List[Dict[str, Any]] = [
-            {
-                "operationName": "SearchProductV5Query",
-                "variables": {"params": params_string},
-                "query": self.GRAPHQL_QUERY,
-            }
-        ]
+        # Only the params string differs between pages; splice it into the
+        # pre-serialized body instead of re-encoding the query every time
+        body = self._payload_template.replace(
+            _PARAMS_PLACEHOLDER_JSON, orjson.dumps(params_string)
+        )
 
         try:
             print(f"   🔍 Making GraphQL request for page {page} (start: {start})...")
 
-            response = self.session.post(self.GRAPHQL_URL, json=payload, timeout=30)
+            response = self.session.post(
+                self.GRAPHQL_URL, data=body, timeout=30
+            )
 
             if response.status_code == 200:
-                data: list[Dict[str, Any]] = response.json()
+                data: list[Dict[str, Any]] = orjson.loads(response.content)
                 if len(data) > 0:
                     return data[0]
                 return cast(Dict[str, Any], data)
@@ -478,6 +376,16 @@ class TokopediaGraphQLScraper:
             print(f"   ❌ Request error: {e}")
             return None
 
+    def _fetch_page(
+        self, query: str, page: int, start: int, delay: float
+    ) -> Optional[Dict[str, Any]]:
+        """Wait out the delay between requests, then fetch a results page."""
+        if delay > 0:
+            print(f"   ⏳ Waiting {delay}s before next request...")
+            time.sleep(delay)
+
+        return self._make_graphql_request(query, page, start)
+
     def _extract_search_id(self, response_data: Dict[str, Any]) -> Optional[str]:
         """Extract search ID from response for pagination consistency."""
         try:
@@ -496,11 +404,15 @@ class TokopediaGraphQLScraper:
         except Exception:
             return None
 
-    def _extract_products_from_response(
+    def _extract_raw_products(
         self, response_data: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        """Extract and format product data from GraphQL response."""
-        products: List[Dict[str, Any]] = []
+        """Extract raw products from GraphQL response and record pagination state.
+
+        The search ID and product IDs are recorded here, before formatting, so
+        the next page can already be requested while this one is formatted.
+        """
+        raw_products: List[Dict[str, Any]] = []
 
         try:
             if "data" in response_data and "searchProductV5" in response_data["data"]:
@@ -509,111 +421,131 @@ class TokopediaGraphQLScraper:
                 # Extract search ID for pagination
                 if not self.search_id:
                     self.search_id = self._extract_search_id(response_data)
+                    if self.search_id:
+                        # Later requests paginate by search ID alone
+                        self.excluded_product_ids.clear()
 
                 if "data" in search_data and "products" in search_data["data"]:
                     raw_products = search_data["data"]["products"]
 
-                    for product in raw_products:
-                        try:
-                            formatted_product = self._format_product(
-                                cast(Dict[str, Any], product)
-                            )
-                            if formatted_product:
-                                products.append(formatted_product)
-
-                                # Track product ID for exclusion in next requests
-                                if "oldID" in product:
-                                    self.excluded_product_ids.append(
-                                        str(product["oldID"])
-                                    )
-
-                        except Exception as e:
-                            print(f"   ⚠️ Error formatting product: {e}")
-                            continue
+                    # Track product IDs for exclusion in next requests, which
+                    # is only needed while no search ID has been returned
+                    if not self.search_id:
+                        for product in raw_products:
+                            if "oldID" in product:
+                                self.excluded_product_ids[str(product["oldID"])] = None
 
         except Exception as e:
             print(f"   ❌ Error extracting products: {e}")
 
+        return raw_products
+
+    def _format_products(
+        self, raw_products: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Format raw GraphQL products, skipping any that fail to format."""
+        products: List[Dict[str, Any]] = []
+
+        # Products in one response were fetched together; stamp them once
+        scraped_at = datetime.now().isoformat()
+
+        for product in raw_products:
+            try:
+                formatted_product = self._format_product(product, scraped_at)
+                if formatted_product:
+                    products.append(formatted_product)
+
+            except Exception as e:
+                print(f"   ⚠️ Error formatting product: {e}")
+                continue
+
         return products
 
-    def _format_product(self, product_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _format_product(
+        self, product_data: Dict[str, Any], scraped_at: str
+    ) -> Optional[Dict[str, Any]]:
         """Format raw product data into standardized structure."""
         try:
-            # Extract basic product information
-            product_id = str(product_data.get("oldID", ""))
-            title = str(product_data.get("name", "")).strip()
-            product_url = str(product_data.get("url", ""))
+            get = product_data.get
+            translate = self.translator.translate
+
+            # Extract basic product information; text fields are already str
+            # in the decoded JSON, only the numeric IDs need converting
+            product_id = str(get("oldID", ""))
+            title = get("name", "").strip()
 
             if not title:
                 return None
 
-            # Extract price information
-            price_data = cast(Dict[str, Any], product_data.get("price", {}))
-            sale_price = str(price_data.get("text", ""))
-            original_price = str(price_data.get("original", sale_price) or sale_price)
-            discount_percentage = int(price_data.get("discountPercentage", 0))
+            # Extract price information; the query selects every field read
+            # here, so rows are indexed directly and .get is only the fallback
+            try:
+                price_data: Dict[str, Any] = product_data["price"]
+                sale_price = price_data["text"] or ""
+                original_price = price_data["original"] or sale_price
+                discount_percentage = int(price_data["discountPercentage"])
+            except (KeyError, TypeError):
+                price_data = get("price") or {}
+                sale_price = price_data.get("text") or ""
+                original_price = price_data.get("original") or sale_price
+                discount_percentage = int(price_data.get("discountPercentage") or 0)
+            # Interned so the many products sharing a price (and an original
+            # price equal to the sale price) reference a single string; a null
+            # price text from the API was turned into "" above
+            if sale_price:
+                sale_price = sys.intern(sale_price)
+            if original_price:
+                original_price = sys.intern(original_price)
 
             # Extract shop information
-            shop_data = cast(Dict[str, Any], product_data.get("shop", {}))
-            store_name = str(shop_data.get("name", ""))
-            store_location = str(shop_data.get("city", ""))
-            store_url = str(shop_data.get("url", ""))
-            store_id = str(shop_data.get("oldID", ""))
+            try:
+                shop_data: Dict[str, Any] = product_data["shop"]
+                store_name = shop_data["name"]
+                store_location = shop_data["city"]
+                store_id = str(shop_data["oldID"])
+                store_url = _abs_url(shop_data["url"])
+            except (KeyError, TypeError):
+                shop_data = get("shop") or {}
+                store_name = shop_data.get("name", "")
+                store_location = shop_data.get("city", "")
+                store_id = str(shop_data.get("oldID", ""))
+                store_url = _abs_url(shop_data.get("url", ""))
+            if not store_url and store_id:
+                # Construct store URL from store ID
+                store_url = f"https://www.tokopedia.com/store/{store_id}"
 
             # Extract image information
-            media_data = cast(Dict[str, Any], product_data.get("mediaURL", {}))
-            image_url = str(
-                media_data.get("image", "") or media_data.get("image300", "")
+            media_data: Dict[str, Any] = get("mediaURL") or {}
+            image_url = _abs_url(
+                media_data.get("image") or media_data.get("image300", "")
             )
 
             # Extract rating
-            rating_raw = product_data.get("rating", 0)
+            rating_raw = get("rating", 0)
             # Ensure rating is a number
             try:
                 rating = float(rating_raw) if rating_raw else 0
             except (ValueError, TypeError):
                 rating = 0
 
-            # Make URLs absolute if needed
-            if product_url and not str(product_url).startswith("http"):
-                if str(product_url).startswith("/"):
-                    product_url = f"https://www.tokopedia.com{product_url}"
-
-            if store_url and not str(store_url).startswith("http"):
-                if str(store_url).startswith("/"):
-                    store_url = f"https://www.tokopedia.com{store_url}"
-            elif not store_url and store_id:
-                # Construct store URL from store ID
-                store_url = f"https://www.tokopedia.com/store/{store_id}"
-
-            if image_url and not str(image_url).startswith("http"):
-                if str(image_url).startswith("//"):
-                    image_url = f"https:{image_url}"
-                elif str(image_url).startswith("/"):
-                    image_url = f"https://www.tokopedia.com{image_url}"
-
             # Format product data
             formatted_product: Dict[str, Any] = {
                 "Product ID": product_id,
-                "Title": self.translator.translate(str(title)),
+                "Title": translate(title),
                 "Sale Price": sale_price,
                 "Original Price": original_price,
                 "Discount (%)": discount_percentage,
                 "Currency": "IDR",
                 "Rating": rating if rating > 0 else None,
                 "Orders Count": None,  # Not available in this API response
-                "Store Name": self.translator.translate(str(store_name))
-                if store_name
-                else None,
+                "Store Name": translate(store_name) if store_name else None,
                 "Store ID": store_id if store_id else None,
                 "Store URL": store_url if store_url else None,
-                "Product URL": product_url,
+                "Product URL": _abs_url(get("url", "")),
                 "Image URL": image_url,
-                "Brand": self.config.get("brand", ""),
-                "Location": self.translator.translate(str(store_location))
-                if store_location
-                else None,
-                "Scraped At": datetime.now().isoformat(),
+                "Brand": self._brand,
+                "Location": translate(store_location) if store_location else None,
+                "Scraped At": scraped_at,
             }
 
             return formatted_product
@@ -648,6 +580,17 @@ class TokopediaGraphQLScraper:
         page = 1
         start = 0
 
+        # Fetches run one page ahead on a worker thread: page N is formatted
+        # while the delay and request for page N + 1 are already under way.
+        # Pages depend on the previous ones' product IDs and search ID, so
+        # there is never more than one request in flight.
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        pending: Optional[Future[Optional[Dict[str, Any]]]] = None
+
+        stream_path: Optional[str] = self.config.get("stream_path")
+        if stream_path:
+            self._stream = open(stream_path, "ab", buffering=STREAM_BUFFER_SIZE)
+
         try:
             while True:
                 # Check limits
@@ -659,28 +602,60 @@ class TokopediaGraphQLScraper:
                     print(f"   📄 Reached target of {max_pages} pages")
                     break
 
-                # Make GraphQL request
-                response_data = self._make_graphql_request(search_query, page, start)
+                # Make GraphQL request, unless it was already prefetched. Only
+                # the first page goes out without the delay between requests
+                if pending is None:
+                    pending = prefetcher.submit(
+                        self._fetch_page,
+                        search_query,
+                        page,
+                        start,
+                        delay if page > 1 else 0,
+                    )
+                response_data = pending.result()
+                pending = None
 
                 if not response_data:
                     print(f"   ❌ Failed to get response for page {page}")
                     break
 
                 # Extract products from response
-                new_products = self._extract_products_from_response(response_data)
+                raw_products = self._extract_raw_products(response_data)
+
+                # Request the next page now if it will be needed
+                if (
+                    raw_products
+                    and not (max_pages and page + 1 > max_pages)
+                    and not (
+                        max_products
+                        and len(self.scraped_products) + len(raw_products)
+                        >= max_products
+                    )
+                ):
+                    pending = prefetcher.submit(
+                        self._fetch_page, search_query, page + 1, start + 60, delay
+                    )
+
+                new_products = self._format_products(raw_products)
 
                 if not new_products:
                     print(f"   📋 No more products found on page {page}")
                     break
 
-                # Add products to collection
+                # Add products to collection; their progress lines are written
+                # to stdout together once the page is done
+                progress_lines: List[str] = []
                 for product in new_products:
                     if max_products and len(self.scraped_products) >= max_products:
                         break
                     self.scraped_products.append(product)
-                    print(
+                    if self._stream:
+                        self._stream.write(orjson.dumps(product) + b"\n")
+                    progress_lines.append(
                         f"   ✓ {len(self.scraped_products)}: {product.get('Title', 'Unknown')[:50]}..."
                     )
+                if progress_lines:
+                    sys.stdout.write("\n".join(progress_lines) + "\n")
 
                 print(
                     f"   📊 Page {page} completed: {len(new_products)} products found"
@@ -690,15 +665,15 @@ class TokopediaGraphQLScraper:
                 page += 1
                 start += 60
 
-                # Delay between requests
-                if delay > 0:
-                    print(f"   ⏳ Waiting {delay}s before next request...")
-                    time.sleep(delay)
-
         except KeyboardInterrupt:
             print("\n🛑 Scraping interrupted by user")
         except Exception as e:
             print(f"\n❌ Scraping error: {e}")
+        finally:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+            if self._stream:
+                self._stream.close()
+                self._stream = None
 
         print("=" * 60)
         print(f"✅ Scraping completed!")
@@ -707,6 +682,12 @@ class TokopediaGraphQLScraper:
         return self.scraped_products
 
 
+def scrape_sync(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a GraphQL scrape to completion; executed in an API worker process."""
+    scraper = TokopediaGraphQLScraper(config)
+    return scraper.scrape_products()
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -768,6 +749,7 @@ def main() -> None:
         
         # Initialize path utils and job metadata
         path_utils = PathUtils()
+        job_index = JobIndex(path_utils.get_job_index_path())
         job_metadata = JobMetadata(
             job_id=job_id,
             parameters={
@@ -780,8 +762,17 @@ def main() -> None:
         
         print(f"\n🆔 Job ID: {job_id}")
         
+        # Create job directories
+        path_utils.ensure_job_dirs(job_id)
+        json_dir = path_utils.get_job_json_dir(job_id)
+        csv_dir = path_utils.get_job_csv_dir(job_id)
+
+        # Products are streamed here while scraping, so an interrupted run
+        # keeps what it collected; it's replaced by results.json on success
+        stream_file = json_dir / "results.jsonl"
+
         # Initialize and run scraper
-        scraper = TokopediaGraphQLScraper(config)
+        scraper = TokopediaGraphQLScraper({**config, "stream_path": str(stream_file)})
         
         job_metadata.update_status(JobStatus.RUNNING)
         products = scraper.scrape_products()
@@ -790,17 +781,13 @@ def main() -> None:
         if products:
             print(f"\nTotal Products Scraped: {len(products)}")
 
-            # Create job directories
-            path_utils.ensure_job_dirs(job_id)
-            json_dir = path_utils.get_job_json_dir(job_id)
-            csv_dir = path_utils.get_job_csv_dir(job_id)
-            
             # Save JSON
             json_file = json_dir / "results.json"
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(products, f, indent=2, ensure_ascii=False)
+            with open(json_file, "wb") as f:
+                f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
             print(f"\n💾 JSON results saved to: {json_file}")
-            job_metadata.add_output_file("json/results.json")
+            job_metadata.set_results_file("json/results.json")
+            stream_file.unlink(missing_ok=True)
             
             # Save CSV
             csv_file = csv_dir / "results.csv"
@@ -816,15 +803,19 @@ def main() -> None:
                 brand=args.brand,
                 max_products=args.max_products,
                 max_pages=args.max_pages,
+                shard_offsets=[
+                    {"file": "json/results.json", "start": 0, "count": len(products)}
+                ],
             )
             job_metadata.update_status(JobStatus.COMPLETED)
-            job_metadata.save(path_utils.get_job_metadata_path(job_id))
+            job_metadata.save(path_utils.get_job_metadata_path(job_id), index=job_index)
             
             print(f"📋 Job metadata saved to: {path_utils.get_job_metadata_path(job_id)}")
         else:
             print("\n⚠️ No products found.")
+            stream_file.unlink(missing_ok=True)
             job_metadata.update_status(JobStatus.FAILED, error_message="No products found")
-            job_metadata.save(path_utils.get_job_metadata_path(job_id))
+            job_metadata.save(path_utils.get_job_metadata_path(job_id), index=job_index)
             sys.exit(1)
 
     except KeyboardInterrupt:
@@ -834,7 +825,7 @@ def main() -> None:
         print(f"\n❌ Error during scraping: {e}")
         if 'job_id' in locals() and 'path_utils' in locals():
             job_metadata.update_status(JobStatus.FAILED, error_message=str(e))
-            job_metadata.save(path_utils.get_job_metadata_path(job_id))
+            job_metadata.save(path_utils.get_job_metadata_path(job_id), index=job_index)
         sys.exit(1)
 
 
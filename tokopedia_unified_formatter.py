@@ -6,14 +6,64 @@ This module formats Tokopedia product and seller data to match the new
 unified CSV format for uploading listings.
 """
 
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Tuple
 
-# Add parent directory to path to import unified modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from unified_csv_writer import UnifiedCSVWriter
+except ImportError:
+    # Not installed; use the unified modules from the parent directory. The
+    # path is appended only when needed, so the extra directory isn't
+    # searched ahead of everything else by later imports
+    sys.path.append(str(Path(__file__).parent.parent))
+    from unified_csv_writer import UnifiedCSVWriter
 
-from unified_csv_writer import UnifiedCSVWriter
+# Product errors listed in the summary printed after process_products
+ERROR_SUMMARY_LIMIT = 5
+
+# First run of digits and separators in a price such as "Rp 299.000"
+_PRICE_RE = re.compile(r"[\d,.]+")
+
+# Deletes the currency prefix and whitespace from "Rp 299.000" or "IDR 299,000"
+_CURRENCY_STRIP = str.maketrans("", "", "RpID \t")
+
+_PRICE_CHARS = "0123456789,."
+
+
+def _first(product_data: Dict[str, Any], keys: Tuple[str, ...], default: Any = "") -> Any:
+    """Return the value of the first of keys present in product_data."""
+    # Stops at the first hit, unlike nested .get calls that evaluate every
+    # fallback; a present key wins even if its value is empty, as before
+    for key in keys:
+        if key in product_data:
+            return product_data[key]
+    return default
+
+
+def _extract_price(price_str: str) -> str:
+    """Return the first run of digits and separators in a price string."""
+    if price_str.isdecimal():
+        return price_str
+
+    # Fast path: with the currency prefix deleted, only the number is left
+    # and it ends the string, so it is exactly the run the regex would find
+    digits = price_str.translate(_CURRENCY_STRIP)
+    if digits and not digits.strip(_PRICE_CHARS) and price_str.endswith(digits):
+        return digits
+
+    price_match = _PRICE_RE.search(price_str)
+    return price_match.group(0) if price_match else "0"
+
+
+def _has_required_keys(product: Any) -> bool:
+    """Whether product is a dict with a title and a price."""
+    return (
+        type(product) is dict
+        and "price" in product
+        and ("product_title" in product or "title" in product)
+    )
 
 
 class TokopediaUnifiedFormatter:
@@ -21,6 +71,8 @@ class TokopediaUnifiedFormatter:
 
     def __init__(self, marketplace: str = "tokopedia"):
         self.marketplace = marketplace
+        # Errors from the last process_products call, one message per product
+        self.errors: List[str] = []
 
     def format_product_to_unified(self, product_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -36,37 +88,40 @@ class TokopediaUnifiedFormatter:
         image_url = ""
         if "product_image_urls" in product_data:
             images = product_data["product_image_urls"]
-            if isinstance(images, list) and len(cast(List[Any], images)) > 0:
-                image_url = str(cast(Any, images[0]))
+            if isinstance(images, list):
+                if images:
+                    image_url = str(images[0])
             elif isinstance(images, str):
                 image_url = images
         elif "image_url" in product_data:
             image_url = str(product_data["image_url"])
 
-        # Extract price
-        price_str = str(product_data.get("price", "0"))
-        # Remove currency symbols (IDR, Rp) and extract numeric value
-        import re
-        price_match = re.search(r"[\d,.]+", price_str)
-        price = price_match.group(0) if price_match else "0"
+        # Extract price; whole-number prices are used as they are (bool and
+        # negative values keep going through the string path, as before)
+        raw_price = product_data.get("price", "0")
+        if type(raw_price) is int and raw_price >= 0:
+            price = str(raw_price)
+        else:
+            # Remove currency symbols (IDR, Rp) and extract numeric value
+            price = _extract_price(str(raw_price))
 
         # Extract seller information
-        seller_name = product_data.get("seller_name", product_data.get("store_name", "Unknown Seller"))
-        seller_url = product_data.get("seller_profile_url", product_data.get("store_url", ""))
+        seller_name = _first(product_data, ("seller_name", "store_name"), "Unknown Seller")
+        seller_url = _first(product_data, ("seller_profile_url", "store_url"))
 
         # Build unified format (using original field names - UnifiedCSVWriter will convert)
         unified_data: Dict[str, Any] = {
-            "product_title": product_data.get("product_title", product_data.get("title", "")),
-            "listing_url": product_data.get("listing_url", product_data.get("url", product_data.get("product_url", ""))),
+            "product_title": _first(product_data, ("product_title", "title")),
+            "listing_url": _first(product_data, ("listing_url", "url", "product_url")),
             "image_url": image_url,
             "price": price,
-            "item_number": product_data.get("item_number", product_data.get("product_id", product_data.get("sku", ""))),
+            "item_number": _first(product_data, ("item_number", "product_id", "sku")),
             "seller_name": seller_name,
             "seller_url": seller_url,
             # Optional fields
             "currency": product_data.get("currency", "IDR"),
-            "shipping": product_data.get("shipping", product_data.get("shipping_cost", "")),
-            "units_available": product_data.get("units_available", product_data.get("stock", "")),
+            "shipping": _first(product_data, ("shipping", "shipping_cost")),
+            "units_available": _first(product_data, ("units_available", "stock")),
             "seller_business_name": product_data.get("seller_business_name", ""),
             "seller_address": product_data.get("physical_address", ""),
             "seller_email": product_data.get("email_address", ""),
@@ -90,16 +145,36 @@ class TokopediaUnifiedFormatter:
         """
         output_path = Path(output_file)
         processed_count = 0
+        errors: List[str] = []
+        self.errors = errors
 
         with UnifiedCSVWriter(marketplace=self.marketplace, output_dir=str(output_path.parent)) as writer:
+            # Bind once; these run for every product
+            format_product = self.format_product_to_unified
+            add_listing = writer.add_listing
+
             for product in products:
+                if product is None:
+                    errors.append("missing product")
+                    continue
+                # Products with the required keys are written unguarded; only
+                # the rest (still written with defaults) run under try/except
+                if _has_required_keys(product):
+                    add_listing(format_product(product))
+                    processed_count += 1
+                    continue
                 try:
-                    unified_data = self.format_product_to_unified(product)
-                    writer.add_listing(unified_data)
+                    add_listing(format_product(product))
                     processed_count += 1
                 except Exception as e:
-                    print(f"⚠️  Error processing product: {e}")
-                    continue
+                    # Reported together after the loop rather than one print each
+                    errors.append(str(e))
+
+        if errors:
+            shown = "; ".join(errors[:ERROR_SUMMARY_LIMIT])
+            more = len(errors) - ERROR_SUMMARY_LIMIT
+            suffix = f" (and {more} more)" if more > 0 else ""
+            print(f"⚠️  {len(errors)} products failed: {shown}{suffix}")
 
         print(f"✅ Processed {processed_count}/{len(products)} products")
         print(f"📄 Output saved to: {output_path}")